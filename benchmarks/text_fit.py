@@ -0,0 +1,106 @@
+"""
+Compare the old linear font-size scan with _fit_text_to_box's pruned scan.
+
+Counts bbox measurements (textbbox / multiline_textbbox calls) and wall time for a few
+representative headline boxes at the master sizes, and checks that both pick the same
+size, including boxes where fit is not monotonic in font size:
+
+    python benchmarks/text_fit.py
+"""
+
+from __future__ import annotations
+
+import time
+
+from PIL import Image, ImageDraw
+
+from performance_genai.assembly.render import _fit_text_to_box, _load_font, _wrap_to_width
+from performance_genai.config import settings
+
+TEXTS = [
+    "Summer sale",
+    "Fresh drops every week, delivered to your door",
+    "The all-new lineup is here: lighter, faster and built for the long run. Shop now.",
+]
+
+# (text, box, max_font_px, min_font_px) where a larger size fits but a smaller one overflows,
+# so anything that assumes monotonic fit (e.g. bisection) picks a smaller font than the scan.
+NON_MONOTONIC_CASES = [
+    (
+        "limited-time get fifty Wi-Fi percent now fifty offer! Summer now get Tokyo Wi-Fi Summer",
+        (0, 0, 280, 139),
+        54,
+        17,
+    ),
+    ("now now Wi-Fi Tokyo get percent", (0, 0, 775, 328), 129, 94),
+]
+
+
+class CountingDraw(ImageDraw.ImageDraw):
+    def __init__(self, im: Image.Image):
+        super().__init__(im)
+        self.calls = 0
+
+    def textbbox(self, *args, **kwargs):
+        self.calls += 1
+        return super().textbbox(*args, **kwargs)
+
+    def multiline_textbbox(self, *args, **kwargs):
+        # Pillow's multiline_textbbox measures via textbbox; count it as one call.
+        self.calls += 1
+        before = self.calls
+        try:
+            return super().multiline_textbbox(*args, **kwargs)
+        finally:
+            self.calls = before
+
+
+def linear_fit(draw, text, box, max_font_px, min_font_px):
+    """The previous implementation: walk sizes down in steps of 2."""
+    x1, y1, x2, y2 = box
+    max_w, max_h = max(1, x2 - x1), max(1, y2 - y1)
+    for px in range(max(min_font_px, max_font_px), min_font_px - 1, -2):
+        font = _load_font(px)
+        spacing = max(2, int(px * 0.18))
+        wrapped = _wrap_to_width(draw, text, font, max_w)
+        bbox = draw.multiline_textbbox((0, 0), wrapped, font=font, spacing=spacing)
+        if bbox[2] - bbox[0] <= max_w and bbox[3] - bbox[1] <= max_h:
+            return font, wrapped, spacing
+    font = _load_font(min_font_px)
+    return font, _wrap_to_width(draw, text, font, max_w), max(2, int(min_font_px * 0.18))
+
+
+def run(fit) -> tuple[int, float, list[int]]:
+    calls, elapsed, sizes = 0, 0.0, []
+    for w, h in settings.master_sizes.values():
+        draw = CountingDraw(Image.new("RGB", (w, h)))
+        box = (int(w * 0.08), int(h * 0.1), int(w * 0.92), int(h * 0.45))
+        for text in TEXTS:
+            t0 = time.perf_counter()
+            font, _, _ = fit(draw, text, box, int(h * 0.2), 18)
+            elapsed += time.perf_counter() - t0
+            sizes.append(font.size)
+        calls += draw.calls
+    draw = CountingDraw(Image.new("RGB", (1080, 1080)))
+    for text, box, max_font_px, min_font_px in NON_MONOTONIC_CASES:
+        t0 = time.perf_counter()
+        font, _, _ = fit(draw, text, box, max_font_px, min_font_px)
+        elapsed += time.perf_counter() - t0
+        sizes.append(font.size)
+    calls += draw.calls
+    return calls, elapsed, sizes
+
+
+def main() -> None:
+    # Warm the font cache so both variants measure layout work only.
+    run(linear_fit)
+    lin_calls, lin_time, lin_sizes = run(linear_fit)
+    new_calls, new_time, new_sizes = run(_fit_text_to_box)
+    print(f"linear: {lin_calls:6d} measure calls  {lin_time * 1000:8.1f} ms")
+    print(f"pruned: {new_calls:6d} measure calls  {new_time * 1000:8.1f} ms")
+    print(f"reduction: {lin_calls / max(1, new_calls):.1f}x calls, {lin_time / max(1e-9, new_time):.1f}x time")
+    print("same sizes:", lin_sizes == new_sizes)
+
+
+if __name__ == "__main__":
+    main()
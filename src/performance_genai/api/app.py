@@ -1,26 +1,70 @@
 from __future__ import annotations
 
-import io
+import hashlib
 import json
+import mimetypes
 import uuid
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
+from urllib.parse import urlencode
 
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from PIL import Image
 
-from performance_genai.assembly.render import render_master_simple, render_text_layout, render_text_layers
+from performance_genai.assembly.canvas import noise_canvas
+from performance_genai.assembly.encoders import (
+    ENCODER_PROFILES,
+    EncodedImage,
+    EncoderProfile,
+    encode_image,
+    resolve_export_profile,
+)
+from performance_genai.assembly.executor import (
+    ElementRef,
+    ImageRef,
+    RenderExecutor,
+    RenderJob,
+    default_render_workers,
+)
+from performance_genai.assembly.derivatives import (
+    DERIVATIVE_FORMATS,
+    normalize_derivative_format,
+    render_derivative,
+    snap_derivative_width,
+)
+from performance_genai.assembly.render import (
+    font_cache_info,
+    pyramid_cache_info,
+    render_text_layout,
+    set_pyramid_cache_max_bytes,
+)
+from performance_genai.assembly.scene import render_text_layers, scene_cache_info
 from performance_genai.config import settings
-from performance_genai.providers.gemini_provider import GeminiProvider
+from performance_genai.disk_cache import DiskCache
+from performance_genai.execution import LoopStallMonitor, blocking_executor, run_blocking
+from performance_genai.image_cache import DecodedImageCache
+from performance_genai.providers.gemini_provider import GeminiProvider, _make_outpaint_canvas
 from performance_genai.providers.openai_provider import OpenAITextProvider
 from performance_genai.storage import ProjectStore
 
 
-app = FastAPI(title="performance_genai prototype")
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    loop_monitor.start()
+    try:
+        yield
+    finally:
+        await loop_monitor.stop()
+        render_executor.shutdown()
+
+
+app = FastAPI(title="performance_genai prototype", lifespan=_lifespan)
 
 BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
@@ -33,6 +77,20 @@ if assets_dir.exists():
     app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
 
 store = ProjectStore()
+# Thumbnails and re-encodes of immutable assets, keyed by source sha256 + params.
+derivative_cache = DiskCache(store.root_dir / "derivatives", settings.derivative_cache_max_bytes)
+# Encoded layout exports, keyed by layout content + input asset hashes + size + encoder settings.
+render_cache = DiskCache(store.root_dir / "renders", settings.render_cache_max_bytes)
+_render_workers = max(0, default_render_workers() if settings.render_workers is None else settings.render_workers)
+# One budget for decoded pixels across processes: each render worker gets the same share as this one.
+decoded_images = DecodedImageCache(settings.decoded_image_cache_max_bytes // (_render_workers + 1))
+set_pyramid_cache_max_bytes(settings.pyramid_cache_max_bytes // (_render_workers + 1))
+render_executor = RenderExecutor(_render_workers, decoded_images)
+# Async handlers hand blocking work to run_blocking / render_executor; this flags what slips through.
+loop_monitor = LoopStallMonitor(settings.loop_stall_warn_ms / 1000)
+
+# Chunk size used when streaming multipart uploads into blob storage.
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 def _get_gemini() -> GeminiProvider:
@@ -47,6 +105,59 @@ def _get_openai_text() -> OpenAITextProvider:
     return OpenAITextProvider(api_key=settings.openai_api_key)
 
 
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await file.read(_UPLOAD_CHUNK_BYTES):
+        yield chunk
+
+
+# Browsers may keep versioned asset URLs forever: the bytes behind a sha256 never change.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _asset_url(project_id: str, asset: Any, **params: Any) -> str:
+    url = f"/projects/{project_id}/assets/{asset.asset_id}"
+    # `v` pins the URL to the content hash so get_asset can mark the response immutable.
+    params.setdefault("v", asset.sha256[:16])
+    query = urlencode({k: v for k, v in params.items() if v is not None})
+    return f"{url}?{query}" if query else url
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+templates.env.globals["asset_url"] = _asset_url
+
+
+def _asset_derivative(project_id: str, asset: Any, w: int | None, fmt: str | None) -> tuple[Path, str, str] | None:
+    """
+    Return (path, media_type, cache key) of a cached resized/re-encoded copy, generating it on a miss.
+    None means the source could not be decoded and the original should be served.
+    """
+    norm_fmt = normalize_derivative_format(fmt)
+    if norm_fmt is None:
+        raise HTTPException(status_code=400, detail=f"fmt must be one of {', '.join(DERIVATIVE_FORMATS)}")
+    width = snap_derivative_width(w)
+    media_type = DERIVATIVE_FORMATS[norm_fmt][1]
+    key = f"{asset.sha256}_w{width or 0}.{norm_fmt}"
+    cached = derivative_cache.get(key)
+    if cached is not None:
+        return cached, media_type, key
+    try:
+        data = render_derivative(store.abs_asset_path(project_id, asset), width, norm_fmt)
+    except Exception:
+        return None
+    return derivative_cache.put(key, data), media_type, key
+
+
 def _parse_bool(value: str | None) -> bool:
     if value is None:
         return False
@@ -62,24 +173,19 @@ def _parse_float(value: str | None, default: float) -> float:
         return default
 
 
+def _canvas_seed(asset: Any) -> int:
+    # Same KV -> same margin noise, so outpaint inputs are reproducible.
+    return int(asset.sha256[:8], 16)
+
+
 def _make_outpaint_canvas_with_box(
     base: Image.Image,
     size: tuple[int, int],
     image_box: dict[str, Any] | None,
+    seed: int | None = None,
 ) -> Image.Image:
     tw, th = size
-    canvas = Image.new("RGB", (tw, th), (128, 128, 128))
-    try:
-        import random
-
-        px = canvas.load()
-        for _ in range(int(tw * th * 0.002)):
-            x = random.randint(0, tw - 1)
-            y = random.randint(0, th - 1)
-            v = 120 + random.randint(0, 20)
-            px[x, y] = (v, v, v)
-    except Exception:
-        pass
+    canvas = noise_canvas((tw, th), seed=seed)
 
     if not image_box:
         iw, ih = base.size
@@ -180,6 +286,11 @@ def _resolve_export_size(ratio: str, size_profile: str) -> tuple[int, int]:
     return size
 
 
+def _write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2), "utf-8")
+
+
 def _load_layout(project_id: str, layout_id: str) -> dict[str, Any]:
     layouts_dir = Path(settings.data_dir) / "projects" / project_id / "layouts"
     layout_path = layouts_dir / f"layout_{layout_id}.json"
@@ -194,45 +305,60 @@ def _load_layout(project_id: str, layout_id: str) -> dict[str, Any]:
     return loaded
 
 
-def _collect_render_elements(project_id: str, proj: Any, layout: dict[str, Any]) -> list[dict[str, Any]]:
-    elements_layout = layout.get("elements") if isinstance(layout.get("elements"), list) else []
-    if not elements_layout:
-        return []
-    out: list[dict[str, Any]] = []
+def _open_asset_image(project_id: str, asset: Any, mode: str | None = None) -> Image.Image:
+    """Decoded pixels for an asset, shared through decoded_images; treat the result as read-only."""
+    return decoded_images.open(asset.sha256, store.abs_asset_path(project_id, asset), mode)
+
+
+def _image_ref(project_id: str, asset: Any, mode: str | None = None) -> ImageRef:
+    # KVs are always decoded as "RGB" (elements as "RGBA"), so renders and exports share one cached copy.
+    return ImageRef(sha256=asset.sha256, path=str(store.abs_asset_path(project_id, asset)), mode=mode)
+
+
+def _collect_element_refs(project_id: str, proj: Any, elements_layout: Any) -> tuple[ElementRef, ...]:
+    if not isinstance(elements_layout, list):
+        return ()
+    out: list[ElementRef] = []
     for el in elements_layout:
         if not isinstance(el, dict):
             continue
-        asset_id = (el.get("asset_id") or "").strip()
+        asset_id = str(el.get("asset_id") or "").strip()
         if not asset_id:
             continue
-        asset = next(
-            (a for a in proj.assets if a.asset_id == asset_id and a.kind in ("element", "motif", "product")),
-            None,
-        )
+        asset = proj.get_asset(asset_id, "element", "motif", "product")
         if not asset:
             continue
-        path = store.abs_asset_path(project_id, asset)
-        if not path.exists():
+        ref = _image_ref(project_id, asset, "RGBA")
+        if not Path(ref.path).exists():
             continue
+        out.append(ElementRef(image=ref, box=el.get("box"), opacity=el.get("opacity", 1)))
+    return tuple(out)
+
+
+def _collect_render_elements(project_id: str, proj: Any, layout: dict[str, Any]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for ref in _collect_element_refs(project_id, proj, layout.get("elements")):
         try:
-            img = Image.open(path).convert("RGBA")
+            img = decoded_images.open(ref.image.sha256, Path(ref.image.path), ref.image.mode)
         except Exception:
             continue
-        out.append({"image": img, "box": el.get("box"), "opacity": el.get("opacity", 1)})
+        out.append({"image": img, "box": ref.box, "opacity": ref.opacity})
     return out
 
 
-def _render_layout_export_png(
+def _render_layout_export(
     project_id: str,
     proj: Any,
     layout: dict[str, Any],
     size: tuple[int, int],
-) -> bytes:
+    profile: EncoderProfile,
+    max_bytes: int | None = None,
+) -> EncodedImage:
     kv_asset_id = (layout.get("kv_asset_id") or "").strip()
-    kv_asset = next((a for a in proj.assets if a.asset_id == kv_asset_id and a.kind == "kv"), None)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
     if not kv_asset:
         raise HTTPException(status_code=400, detail="layout kv_asset_id is missing or invalid")
-    kv_img = Image.open(store.abs_asset_path(project_id, kv_asset)).convert("RGB")
+    kv_img = _open_asset_image(project_id, kv_asset, "RGB")
     render_elements = _collect_render_elements(project_id, proj, layout)
     if layout.get("text_layers"):
         rendered = render_text_layers(
@@ -263,7 +389,85 @@ def _render_layout_export_png(
             elements=render_elements,
             shapes=layout.get("shapes") or [],
         )
-    return _pil_to_png_bytes(rendered.image)
+    return encode_image(rendered.image, profile, max_bytes=max_bytes)
+
+
+# Bump when renderer output changes so stale cached exports stop matching.
+_RENDER_CACHE_VERSION = 1
+# Bookkeeping keys that never affect pixels; identical layouts share cache entries.
+_LAYOUT_IDENTITY_KEYS = {"layout_id", "source_layout_id", "layout_kind"}
+
+
+def _render_cache_key(
+    project_id: str,
+    proj: Any,
+    layout: dict[str, Any],
+    size: tuple[int, int],
+    profile: EncoderProfile,
+    max_bytes: int | None,
+) -> str | None:
+    kv_asset = proj.get_asset((layout.get("kv_asset_id") or "").strip(), "kv")
+    if not kv_asset:
+        return None
+    payload = {
+        "v": _RENDER_CACHE_VERSION,
+        "layout": {k: v for k, v in layout.items() if k not in _LAYOUT_IDENTITY_KEYS},
+        "kv": kv_asset.sha256,
+        "elements": [ref.image.sha256 for ref in _collect_element_refs(project_id, proj, layout.get("elements"))],
+        "size": list(size),
+        "encoder": {
+            "profile": profile.name,
+            "format": profile.format,
+            "params": profile.params,
+            "quality": profile.quality,
+            "min_quality": profile.min_quality,
+            "max_bytes": max_bytes,
+        },
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _cached_layout_export(
+    project_id: str,
+    proj: Any,
+    layout: dict[str, Any],
+    size: tuple[int, int],
+    profile: EncoderProfile,
+    max_bytes: int | None = None,
+) -> tuple[EncodedImage, bool]:
+    """_render_layout_export through render_cache; returns (encoded, cache_hit)."""
+    key = _render_cache_key(project_id, proj, layout, size, profile, max_bytes)
+    cached = render_cache.get(key) if key else None
+    if cached is not None:
+        try:
+            data = cached.read_bytes()
+        except FileNotFoundError:
+            data = None  # Evicted between lookup and read.
+        if data is not None:
+            encoded = EncodedImage(
+                data=data,
+                profile=profile.name,
+                media_type=profile.media_type,
+                extension=profile.extension,
+                encode_ms=0.0,
+            )
+            return encoded, True
+    encoded = _render_layout_export(project_id, proj, layout, size, profile, max_bytes)
+    if key:
+        render_cache.put(key, encoded.data)
+    return encoded, False
+
+
+def _export_encoding(export_format: str, max_kb: str) -> tuple[EncoderProfile, int | None]:
+    try:
+        profile = resolve_export_profile(export_format)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    # The byte cap only applies to lossy formats; PNG size is not tunable by quality.
+    cap_kb = _parse_float(max_kb, 0.0)
+    max_bytes = int(cap_kb * 1024) if cap_kb > 0 and profile.quality is not None else None
+    return profile, max_bytes
 
 
 def _parse_json_list_payload(raw: str, label: str) -> list[dict[str, Any]]:
@@ -361,12 +565,12 @@ def create_project(name: str = Form(...), brand_name: str = Form(""), campaign_n
 def project_page(request: Request, project_id: str):
     proj = store.read_project(project_id)
     assets = list(reversed(proj.assets))
-    kvs = [a for a in assets if a.kind == "kv"]
+    kvs = list(reversed(proj.assets_of_kind("kv")))
     base_kvs = [a for a in kvs if not (a.metadata or {}).get("source_kv_asset_id")]
     ratio_kvs = [a for a in kvs if (a.metadata or {}).get("source_kv_asset_id")]
-    text_previews = [a for a in assets if a.kind == "text_preview"]
-    masters = [a for a in assets if a.kind == "master"]
-    motifs = [a for a in assets if a.kind == "motif"]
+    text_previews = list(reversed(proj.assets_of_kind("text_preview")))
+    masters = list(reversed(proj.assets_of_kind("master")))
+    motifs = list(reversed(proj.assets_of_kind("motif")))
     selected_kv = request.query_params.get("kv") or ""
     selected_headline = request.query_params.get("headline") or ""
 
@@ -414,13 +618,12 @@ def project_page(request: Request, project_id: str):
 @app.get("/projects/{project_id}/editor", response_class=HTMLResponse)
 def editor_page(request: Request, project_id: str, layout_id: str = ""):
     proj = store.read_project(project_id)
-    assets = list(reversed(proj.assets))
-    kvs = [a for a in assets if a.kind == "kv"]
+    kvs = list(reversed(proj.assets_of_kind("kv")))
     kv_choices = [
         {
             "id": a.asset_id,
             "label": (a.metadata or {}).get("display_name") or a.filename,
-            "url": f"/projects/{project_id}/assets/{a.asset_id}",
+            "url": _asset_url(project_id, a),
         }
         for a in kvs
     ]
@@ -444,8 +647,8 @@ def editor_page(request: Request, project_id: str, layout_id: str = ""):
     except Exception:
         copy_sets = []
 
-    text_previews = [a for a in assets if a.kind == "text_preview"]
-    insert_assets = [a for a in assets if a.kind in ("element", "motif", "product")]
+    text_previews = list(reversed(proj.assets_of_kind("text_preview")))
+    insert_assets = list(reversed(proj.assets_of_kind("element", "motif", "product")))
     return templates.TemplateResponse(
         request=request,
         name="editor.html",
@@ -469,22 +672,37 @@ async def upload_asset(
     return_to: str = Form(""),
     file: UploadFile = File(...),
 ):
-    content = await file.read()
-    subdir = "assets"
-    if kind == "motif":
-        subdir = "motifs"
-    store.add_asset(
+    await store.add_asset_stream(
         project_id=project_id,
         kind=kind,
         filename=file.filename or "upload.bin",
-        content=content,
+        chunks=_iter_upload(file),
         metadata={"content_type": file.content_type},
-        subdir=subdir,
     )
     redirect_path = _safe_return_path(return_to) or f"/projects/{project_id}"
     return RedirectResponse(url=redirect_path, status_code=303)
 
 
+@app.post("/projects/{project_id}/assets/upload_batch")
+async def upload_assets(
+    project_id: str,
+    kind: str = Form("reference"),
+    return_to: str = Form(""),
+    files: list[UploadFile] = File(...),
+):
+    # One request, one metadata commit for the whole batch.
+    async with store.async_transaction(project_id) as tx:
+        for file in files:
+            await tx.add_asset_stream(
+                kind=kind,
+                filename=file.filename or "upload.bin",
+                chunks=_iter_upload(file),
+                metadata={"content_type": file.content_type},
+            )
+    redirect_path = _safe_return_path(return_to) or f"/projects/{project_id}"
+    return RedirectResponse(url=redirect_path, status_code=303)
+
+
 @app.post("/projects/{project_id}/layouts/{layout_id}/outpaint")
 async def outpaint_layout(
     project_id: str,
@@ -495,26 +713,24 @@ async def outpaint_layout(
         "Do not change or edit existing content."
     ),
 ):
-    proj = store.read_project(project_id)
+    proj = await run_blocking(store.read_project, project_id)
     layouts_dir = Path(settings.data_dir) / "projects" / project_id / "layouts"
-    layout_path = layouts_dir / f"layout_{layout_id}.json"
-    if not layout_path.exists():
-        raise HTTPException(status_code=404, detail="layout not found")
-
-    layout = json.loads(layout_path.read_text("utf-8"))
+    layout = await run_blocking(_load_layout, project_id, layout_id)
     ratio = layout.get("ratio") or layout.get("guide_ratio") or "1:1"
     size = settings.master_sizes.get(ratio)
     if not size:
         raise HTTPException(status_code=400, detail="ratio not supported for outpaint")
 
     kv_asset_id = layout.get("kv_asset_id") or ""
-    kv_asset = next((a for a in proj.assets if a.asset_id == kv_asset_id and a.kind == "kv"), None)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
     if not kv_asset:
         raise HTTPException(status_code=400, detail="kv_asset_id must be an existing KV asset")
 
     kv_path = store.abs_asset_path(project_id, kv_asset)
-    base_img = Image.open(kv_path).convert("RGB")
-    locked_canvas = _make_outpaint_canvas_with_box(base_img, size, layout.get("image_box"))
+    base_img = await run_blocking(_open_asset_image, project_id, kv_asset, "RGB")
+    locked_canvas = await run_blocking(
+        _make_outpaint_canvas_with_box, base_img, size, layout.get("image_box"), seed=_canvas_seed(kv_asset)
+    )
 
     gemini = _get_gemini()
     sys_constraints = _build_reframe_constraints(False)
@@ -532,117 +748,95 @@ async def outpaint_layout(
 
     source_label = (kv_asset.metadata or {}).get("display_name") or kv_asset.filename
     display_label = f"{source_label}_outpaint_{ratio}"
-    buf = _pil_to_png_bytes(images[0].image)
-    out_asset = store.add_asset(
-        project_id=project_id,
-        kind="kv",
-        filename="kv_outpaint.png",
-        content=buf,
-        metadata={
-            "provider": images[0].provider,
-            "model": images[0].model,
-            "prompt": images[0].prompt_used,
-            "source_kv_asset_id": kv_asset_id,
-            "aspect_ratio": ratio,
-            "image_size": image_size,
-            "display_name": display_label,
-            "source_layout_id": layout_id,
-            "image_box": layout.get("image_box"),
-        },
-        subdir="kvs",
-    )
-
-    new_layout_id = uuid.uuid4().hex[:12]
-    new_layout = dict(layout)
-    new_layout.update(
-        {
-            "layout_id": new_layout_id,
-            "layout_kind": "ratio_outpaint",
-            "source_layout_id": layout_id,
-            "ratio": ratio,
-            "kv_asset_id": out_asset.asset_id,
-            "guide_ratio": ratio,
-            "image_box": None,
-        }
-    )
-    (layouts_dir / f"layout_{new_layout_id}.json").write_text(json.dumps(new_layout, indent=2), "utf-8")
-
-    elements_layout = new_layout.get("elements") if isinstance(new_layout.get("elements"), list) else []
-    render_elements: list[dict] = []
-    if elements_layout:
-        for el in elements_layout:
-            if not isinstance(el, dict):
-                continue
-            asset_id = (el.get("asset_id") or "").strip()
-            if not asset_id:
-                continue
-            asset = next(
-                (a for a in proj.assets if a.asset_id == asset_id and a.kind in ("element", "motif", "product")),
-                None,
-            )
-            if not asset:
-                continue
-            path = store.abs_asset_path(project_id, asset)
-            if not path.exists():
-                continue
-            try:
-                img = Image.open(path).convert("RGBA")
-            except Exception:
-                continue
-            render_elements.append(
-                {
-                    "image": img,
-                    "box": el.get("box"),
-                    "opacity": el.get("opacity", 1),
-                }
-            )
+    buf = await run_blocking(_pil_to_png_bytes, images[0].image)
+    async with store.async_transaction(project_id) as tx:
+        out_asset = await run_blocking(
+            tx.add_asset,
+            kind="kv",
+            filename="kv_outpaint.png",
+            content=buf,
+            metadata={
+                "provider": images[0].provider,
+                "model": images[0].model,
+                "prompt": images[0].prompt_used,
+                "source_kv_asset_id": kv_asset_id,
+                "aspect_ratio": ratio,
+                "image_size": image_size,
+                "display_name": display_label,
+                "source_layout_id": layout_id,
+                "image_box": layout.get("image_box"),
+            },
+        )
 
-    kv_img = Image.open(store.abs_asset_path(project_id, out_asset)).convert("RGB")
-    if new_layout.get("text_layers"):
-        rendered = render_text_layers(
-            kv=kv_img,
-            size=size,
-            text_layers=new_layout.get("text_layers") or [],
-            font_family=new_layout.get("font_family") or "dejavu",
-            text_color_hex=new_layout.get("text_color") or "#ffffff",
-            text_align=new_layout.get("text_align") or "left",
-            image_box=None,
-            elements=render_elements,
-            shapes=new_layout.get("shapes") or [],
+        new_layout_id = uuid.uuid4().hex[:12]
+        new_layout = dict(layout)
+        new_layout.update(
+            {
+                "layout_id": new_layout_id,
+                "layout_kind": "ratio_outpaint",
+                "source_layout_id": layout_id,
+                "ratio": ratio,
+                "kv_asset_id": out_asset.asset_id,
+                "guide_ratio": ratio,
+                "image_box": None,
+            }
         )
-    else:
-        rendered = render_text_layout(
-            kv=kv_img,
-            size=size,
-            headline=new_layout.get("headline") or "",
-            subhead=new_layout.get("subhead") or "",
-            cta=new_layout.get("cta") or "",
-            font_family=new_layout.get("font_family") or "dejavu",
-            text_color_hex=new_layout.get("text_color") or "#ffffff",
-            text_align=new_layout.get("text_align") or "left",
-            headline_box=new_layout.get("headline_box"),
-            subhead_box=new_layout.get("subhead_box"),
-            cta_box=new_layout.get("cta_box"),
-            image_box=None,
-            elements=render_elements,
-            shapes=new_layout.get("shapes") or [],
+
+        if new_layout.get("text_layers"):
+            renderer = "text_layers"
+            render_options: dict[str, Any] = {
+                "text_layers": new_layout.get("text_layers") or [],
+                "font_family": new_layout.get("font_family") or "dejavu",
+                "text_color_hex": new_layout.get("text_color") or "#ffffff",
+                "text_align": new_layout.get("text_align") or "left",
+                "image_box": None,
+                "shapes": new_layout.get("shapes") or [],
+            }
+        else:
+            renderer = "text_layout"
+            render_options = {
+                "headline": new_layout.get("headline") or "",
+                "subhead": new_layout.get("subhead") or "",
+                "cta": new_layout.get("cta") or "",
+                "font_family": new_layout.get("font_family") or "dejavu",
+                "text_color_hex": new_layout.get("text_color") or "#ffffff",
+                "text_align": new_layout.get("text_align") or "left",
+                "headline_box": new_layout.get("headline_box"),
+                "subhead_box": new_layout.get("subhead_box"),
+                "cta_box": new_layout.get("cta_box"),
+                "image_box": None,
+                "shapes": new_layout.get("shapes") or [],
+            }
+        [rendered] = await render_executor.render(
+            [
+                RenderJob(
+                    renderer=renderer,
+                    kv=_image_ref(project_id, out_asset, "RGB"),
+                    size=size,
+                    options=render_options,
+                    elements=_collect_element_refs(project_id, proj, new_layout.get("elements")),
+                    encoder="text_preview",
+                )
+            ]
         )
 
-    preview_asset = store.add_asset(
-        project_id=project_id,
-        kind="text_preview",
-        filename="layout_outpaint_preview.png",
-        content=_pil_to_png_bytes(rendered.image),
-        metadata={
-            "ratio": ratio,
-            "ratio_layout_id": new_layout_id,
-            "source_layout_id": layout_id,
-            "outpaint_kv_asset_id": out_asset.asset_id,
-        },
-        subdir="text_previews",
-    )
+        preview_asset = await run_blocking(
+            tx.add_asset,
+            kind="text_preview",
+            filename="layout_outpaint_preview.png",
+            content=rendered.encoded.data,
+            metadata={
+                "ratio": ratio,
+                "ratio_layout_id": new_layout_id,
+                "source_layout_id": layout_id,
+                "outpaint_kv_asset_id": out_asset.asset_id,
+            },
+        )
+    # Written only after the commit, so a rolled-back outpaint leaves no layout pointing at its assets.
+    await run_blocking(_write_json, layouts_dir / f"layout_{new_layout_id}.json", new_layout)
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "layout_outpaint",
@@ -666,16 +860,37 @@ def export_layout(
     project_id: str,
     layout_id: str,
     size_profile: str = Form("performance_default"),
+    export_format: str = Form("png"),
+    max_kb: str = Form(""),
 ):
     proj = store.read_project(project_id)
+    profile, max_bytes = _export_encoding(export_format, max_kb)
     layout = _load_layout(project_id, layout_id)
     ratio = (layout.get("ratio") or layout.get("guide_ratio") or "1:1").strip() or "1:1"
     size = _resolve_export_size(ratio, size_profile)
-    png = _render_layout_export_png(project_id, proj, layout, size)
+    encoded, cache_hit = _cached_layout_export(project_id, proj, layout, size, profile, max_bytes)
+    store.write_run_manifest(
+        project_id,
+        {
+            "type": "layout_export",
+            "provider": "pillow",
+            "model": "render_layout_export",
+            "inputs": {
+                "layout_id": layout_id,
+                "size_profile": size_profile,
+                "size": list(size),
+                "export_format": profile.name,
+                "max_bytes": max_bytes,
+            },
+            "outputs": {"files": 1, "failed": []},
+            "encoding": encoded.stats(),
+            "render_cache": "hit" if cache_hit else "miss",
+        },
+    )
     safe_ratio = ratio.replace(":", "x")
-    filename = f"layout_{safe_ratio}_{size[0]}x{size[1]}.png"
+    filename = f"layout_{safe_ratio}_{size[0]}x{size[1]}.{encoded.extension}"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return Response(content=png, media_type="image/png", headers=headers)
+    return Response(content=encoded.data, media_type=encoded.media_type, headers=headers)
 
 
 @app.post("/projects/{project_id}/layouts/export_current")
@@ -691,15 +906,18 @@ def export_current_layout(
     text_color: str = Form("#ffffff"),
     text_align: str = Form("left"),
     size_profile: str = Form("performance_default"),
+    export_format: str = Form("png"),
+    max_kb: str = Form(""),
 ):
     proj = store.read_project(project_id)
-    kv_asset = next((a for a in proj.assets if a.asset_id == kv_asset_id and a.kind == "kv"), None)
+    profile, max_bytes = _export_encoding(export_format, max_kb)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
     if not kv_asset:
         raise HTTPException(status_code=400, detail="kv_asset_id must be an existing KV asset")
 
     ratio = (guide_ratio or "1:1").strip() or "1:1"
     size = _resolve_export_size(ratio, size_profile)
-    kv_img = Image.open(store.abs_asset_path(project_id, kv_asset)).convert("RGB")
+    kv_img = _open_asset_image(project_id, kv_asset, "RGB")
 
     image_box_payload = None
     if image_box.strip():
@@ -746,11 +964,86 @@ def export_current_layout(
             shapes=shapes_layout,
         )
 
-    png = _pil_to_png_bytes(rendered.image)
+    encoded = encode_image(rendered.image, profile, max_bytes=max_bytes)
     safe_ratio = ratio.replace(":", "x")
-    filename = f"canvas_{safe_ratio}_{size[0]}x{size[1]}.png"
+    filename = f"canvas_{safe_ratio}_{size[0]}x{size[1]}.{encoded.extension}"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return Response(content=png, media_type="image/png", headers=headers)
+    return Response(content=encoded.data, media_type=encoded.media_type, headers=headers)
+
+
+@app.post("/projects/{project_id}/layouts/live")
+async def live_preview_layout(
+    project_id: str,
+    kv_asset_id: str = Form(...),
+    text_layers: str = Form(""),
+    image_box: str = Form(""),
+    elements: str = Form(""),
+    shapes: str = Form(""),
+    guide_ratio: str = Form("1:1"),
+    font_family: str = Form("dejavu"),
+    text_color: str = Form("#ffffff"),
+    text_align: str = Form("left"),
+    size_profile: str = Form("performance_default"),
+    max_width: str = Form(""),
+    export_format: str = Form(""),
+):
+    """
+    Stateless render of the editor payload at one ratio. Nothing is written: no assets,
+    layout files or run manifests, so it is safe to call on every edit. KV and element
+    pixels come from the decoded-image cache.
+    """
+    proj = await run_blocking(store.read_project, project_id)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
+    if not kv_asset:
+        raise HTTPException(status_code=400, detail="kv_asset_id must be an existing KV asset")
+    try:
+        profile = resolve_export_profile(export_format) if export_format.strip() else ENCODER_PROFILES["text_preview"]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    ratio = (guide_ratio or "1:1").strip() or "1:1"
+    size = _resolve_export_size(ratio, size_profile)
+    width_cap = int(_parse_float(max_width, 0.0))
+    if 0 < width_cap < size[0]:
+        size = (width_cap, max(1, round(size[1] * width_cap / size[0])))
+
+    image_box_payload = None
+    if image_box.strip():
+        try:
+            parsed_box = json.loads(image_box)
+            if isinstance(parsed_box, dict):
+                image_box_payload = parsed_box
+        except Exception:
+            image_box_payload = None
+
+    layers_payload = _parse_json_list_payload(text_layers, "text_layers")
+    elements_layout = _normalize_elements_for_render(_parse_json_list_payload(elements, "elements"))
+    shapes_layout = _normalize_shapes_for_render(_parse_json_list_payload(shapes, "shapes"))
+
+    # No layers is still a valid render: KV, shapes and elements only.
+    options: dict[str, Any] = {
+        "text_layers": layers_payload,
+        "font_family": font_family,
+        "text_color_hex": text_color,
+        "text_align": text_align,
+        "image_box": image_box_payload,
+        "shapes": shapes_layout,
+    }
+    job = RenderJob(
+        renderer="text_layers",
+        kv=_image_ref(project_id, kv_asset, "RGB"),
+        size=size,
+        options=options,
+        elements=_collect_element_refs(project_id, proj, elements_layout),
+        encoder=profile.name,
+    )
+    (result,) = await render_executor.render([job])
+    encoded = result.encoded
+    return Response(
+        content=encoded.data,
+        media_type=encoded.media_type,
+        headers={"Cache-Control": "no-store", "X-Render-Size": f"{size[0]}x{size[1]}"},
+    )
 
 
 @app.post("/projects/{project_id}/layouts/export_selected")
@@ -758,11 +1051,15 @@ def export_selected_layouts(
     project_id: str,
     asset_ids: list[str] = Form(default=[]),
     size_profile: str = Form("performance_default"),
+    export_format: str = Form("png"),
+    max_kb: str = Form(""),
 ):
     if not asset_ids:
         raise HTTPException(status_code=400, detail="select at least one preview")
     proj = store.read_project(project_id)
-    selected_previews = [a for a in proj.assets if a.kind == "text_preview" and a.asset_id in set(asset_ids)]
+    profile, max_bytes = _export_encoding(export_format, max_kb)
+    selected = set(asset_ids)
+    selected_previews = [a for a in proj.assets_of_kind("text_preview") if a.asset_id in selected]
     layout_ids: list[str] = []
     seen: set[str] = set()
     for preview in selected_previews:
@@ -775,27 +1072,103 @@ def export_selected_layouts(
     if not layout_ids:
         raise HTTPException(status_code=400, detail="selected previews do not contain exportable layouts")
 
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        written = 0
-        for idx, lid in enumerate(layout_ids, start=1):
-            try:
-                layout = _load_layout(project_id, lid)
-                ratio = (layout.get("ratio") or layout.get("guide_ratio") or "1:1").strip() or "1:1"
-                size = _resolve_export_size(ratio, size_profile)
-                png = _render_layout_export_png(project_id, proj, layout, size)
-            except Exception:
-                continue
-            safe_ratio = ratio.replace(":", "x")
-            name = f"{idx:02d}_{safe_ratio}_{size[0]}x{size[1]}_{lid[:6]}.png"
-            zf.writestr(name, png)
-            written += 1
-    if written == 0:
+    # Layout files and sizes are checked up front so a bad selection still gets a 400;
+    # once streaming starts, render failures can only be reported inside the archive.
+    jobs: list[tuple[int, str, dict[str, Any], str, tuple[int, int]]] = []
+    failed: list[dict[str, Any]] = []
+    for idx, lid in enumerate(layout_ids, start=1):
+        try:
+            layout = _load_layout(project_id, lid)
+            ratio = (layout.get("ratio") or layout.get("guide_ratio") or "1:1").strip() or "1:1"
+            size = _resolve_export_size(ratio, size_profile)
+        except HTTPException as exc:
+            failed.append({"layout_id": lid, "error": str(exc.detail)})
+            continue
+        jobs.append((idx, lid, layout, ratio, size))
+    if not jobs:
         raise HTTPException(status_code=400, detail="no exports could be generated")
 
-    zip_bytes = buf.getvalue()
+    def export_one(job: tuple[int, str, dict[str, Any], str, tuple[int, int]]) -> tuple[EncodedImage, bool]:
+        _, _, layout, _, size = job
+        return _cached_layout_export(project_id, proj, layout, size, profile, max_bytes)
+
+    def stream() -> Iterator[bytes]:
+        sink = _ZipSink()
+        exported: list[dict[str, Any]] = []
+        pending: dict[Future, tuple[int, str, dict[str, Any], str, tuple[int, int]]] = {}
+        queue = list(jobs)
+        # Bounded in flight so a slow client doesn't pile up finished renders in memory, and
+        # kept to half the shared blocking pool so other run_blocking work isn't queued behind it.
+        window = max(1, settings.blocking_workers // 2)
+        try:
+            with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as zf:
+                while queue or pending:
+                    while queue and len(pending) < window:
+                        job = queue.pop(0)
+                        pending[blocking_executor.submit(export_one, job)] = job
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        idx, lid, _, ratio, size = pending.pop(future)
+                        try:
+                            encoded, cache_hit = future.result()
+                        except Exception as exc:
+                            failed.append({"layout_id": lid, "error": str(exc) or type(exc).__name__})
+                            continue
+                        safe_ratio = ratio.replace(":", "x")
+                        name = f"{idx:02d}_{safe_ratio}_{size[0]}x{size[1]}_{lid[:6]}.{encoded.extension}"
+                        # Image payloads are already compressed; store them as-is.
+                        zf.writestr(name, encoded.data, compress_type=zipfile.ZIP_STORED)
+                        exported.append(
+                            {"layout_id": lid, "file": name} | encoded.stats() | {"cache": "hit" if cache_hit else "miss"}
+                        )
+                        yield sink.drain()
+                summary = {"exported": exported, "failed": failed}
+                zf.writestr("manifest.json", json.dumps(summary, indent=2), compress_type=zipfile.ZIP_DEFLATED)
+            yield sink.drain()
+        finally:
+            for future in pending:
+                future.cancel()
+
+        cache_hits = sum(1 for e in exported if e["cache"] == "hit")
+        store.write_run_manifest(
+            project_id,
+            {
+                "type": "layout_export",
+                "provider": "pillow",
+                "model": "render_layout_export",
+                "inputs": {
+                    "layout_ids": layout_ids,
+                    "size_profile": size_profile,
+                    "export_format": profile.name,
+                    "max_bytes": max_bytes,
+                },
+                "outputs": {"files": len(exported), "failed": failed},
+                "encoding": {e["layout_id"]: {k: v for k, v in e.items() if k not in ("layout_id", "file")} for e in exported},
+                "render_cache": {"hits": cache_hits, "misses": len(exported) - cache_hits},
+            },
+        )
+
     headers = {"Content-Disposition": 'attachment; filename="selected_layout_exports.zip"'}
-    return Response(content=zip_bytes, media_type="application/zip", headers=headers)
+    return StreamingResponse(stream(), media_type="application/zip", headers=headers)
+
+
+class _ZipSink:
+    """Write-only, unseekable file object: zipfile streams entries with data descriptors."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
 
 
 @app.post("/projects/{project_id}/delete")
@@ -807,15 +1180,13 @@ def delete_project(project_id: str):
 @app.post("/projects/{project_id}/assets/{asset_id}/delete")
 def delete_asset(project_id: str, asset_id: str, return_to: str = Form("")):
     proj = store.read_project(project_id)
-    asset = next((a for a in proj.assets if a.asset_id == asset_id), None)
+    asset = proj.get_asset(asset_id)
+    to_delete = [asset_id]
     if asset and asset.kind == "text_preview":
         linked = (asset.metadata or {}).get("outpaint_kv_asset_id")
         if linked:
-            try:
-                store.delete_asset(project_id, linked)
-            except Exception:
-                pass
-    store.delete_asset(project_id, asset_id)
+            to_delete.append(linked)
+    store.delete_assets(project_id, to_delete)
     redirect_path = _safe_return_path(return_to) or f"/projects/{project_id}"
     return RedirectResponse(url=redirect_path, status_code=303)
 
@@ -829,22 +1200,19 @@ def bulk_delete_assets(
 ):
     # v0: best-effort bulk delete for faster iteration.
     proj = store.read_project(project_id)
-    if asset_kind:
-        allowed = {a.asset_id for a in proj.assets if a.kind == asset_kind}
-    else:
-        allowed = {a.asset_id for a in proj.assets}
+    to_delete: list[str] = []
     for asset_id in asset_ids:
-        if asset_id not in allowed:
-            continue
-        try:
-            asset = next((a for a in proj.assets if a.asset_id == asset_id), None)
-            if asset and asset.kind == "text_preview":
-                linked = (asset.metadata or {}).get("outpaint_kv_asset_id")
-                if linked:
-                    store.delete_asset(project_id, linked)
-            store.delete_asset(project_id, asset_id)
-        except Exception:
+        asset = proj.get_asset(asset_id, asset_kind) if asset_kind else proj.get_asset(asset_id)
+        if asset is None:
             continue
+        if asset.kind == "text_preview":
+            linked = (asset.metadata or {}).get("outpaint_kv_asset_id")
+            if linked:
+                to_delete.append(linked)
+        to_delete.append(asset_id)
+    if to_delete:
+        # One journal record and catalog update for the whole selection.
+        store.delete_assets(project_id, to_delete)
     redirect_path = _safe_return_path(return_to) or f"/projects/{project_id}"
     return RedirectResponse(url=redirect_path, status_code=303)
 
@@ -882,15 +1250,58 @@ def delete_headlines(
 
 
 @app.get("/projects/{project_id}/assets/{asset_id}")
-def get_asset(project_id: str, asset_id: str):
+def get_asset(
+    request: Request,
+    project_id: str,
+    asset_id: str,
+    w: int | None = None,
+    fmt: str | None = None,
+    v: str | None = None,
+):
     proj = store.read_project(project_id)
-    match = next((a for a in proj.assets if a.asset_id == asset_id), None)
+    match = proj.get_asset(asset_id)
     if not match:
         raise HTTPException(status_code=404, detail="asset not found")
     path = store.abs_asset_path(project_id, match)
     if not path.exists():
         raise HTTPException(status_code=404, detail="asset file missing")
-    return FileResponse(path)
+
+    # Assets are immutable, so the content hash is a strong validator. Unversioned URLs
+    # still revalidate on every use but only pay for a 304.
+    versioned = bool(v) and match.sha256.startswith(v)
+    cache_control = _IMMUTABLE_CACHE_CONTROL if versioned else "no-cache"
+    # Blobs are stored by hash without an extension, so the type comes from the asset record.
+    media_type = (match.metadata or {}).get("content_type") or mimetypes.guess_type(match.filename)[0]
+    etag = f'"{match.sha256}"'
+    if w is not None or fmt:
+        derived = _asset_derivative(project_id, match, w, fmt)
+        if derived is not None:
+            path, media_type, key = derived
+            etag = f'"{key}"'
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    # FileResponse answers Range / If-Range requests against the same ETag.
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+@app.get("/debug/cache_stats")
+def cache_stats():
+    return {
+        "project_cache": store.project_cache_info(),
+        "derivative_cache": derivative_cache.info(),
+        "render_cache": render_cache.info(),
+        "font_cache": font_cache_info(),
+        "scene_cache": scene_cache_info(),
+        "decoded_images": decoded_images.info(),
+        "pyramids": pyramid_cache_info(),
+    }
+
+
+@app.get("/debug/loop_stats")
+def loop_stats():
+    return loop_monitor.info()
 
 
 @app.post("/projects/{project_id}/profile/propose")
@@ -898,18 +1309,16 @@ async def propose_profile(
     project_id: str,
     brief_text: str = Form(""),
 ):
-    proj = store.read_project(project_id)
-    ref_paths: list[Path] = []
-    for a in proj.assets:
-        if a.kind in ("reference", "product", "kv"):
-            ref_paths.append(store.abs_asset_path(project_id, a))
+    proj = await run_blocking(store.read_project, project_id)
+    ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets_of_kind("reference", "product", "kv")]
     if not ref_paths:
         raise HTTPException(status_code=400, detail="upload at least one reference image first")
 
     gemini = _get_gemini()
     res = await gemini.propose_observed_profile(reference_images=ref_paths[:8], brief_text=brief_text)
-    store.write_observed_profile(project_id, res.profile)
-    store.write_run_manifest(
+    await run_blocking(store.write_observed_profile, project_id, res.profile)
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "profile_propose",
@@ -929,36 +1338,37 @@ async def generate_kvs(
     aspect_ratio: str = Form("1:1"),
     use_images: bool = Form(True),
 ):
-    proj = store.read_project(project_id)
+    proj = await run_blocking(store.read_project, project_id)
     ref_paths: list[Path] = []
     if use_images:
-        ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets if a.kind in ("reference", "product")]
+        ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets_of_kind("reference", "product")]
 
     gemini = _get_gemini()
     images = await gemini.generate(prompt=prompt, reference_images=ref_paths[:8], n=int(n), aspect_ratio=aspect_ratio)
 
     kv_asset_ids: list[str] = []
-    existing_base = [a for a in proj.assets if a.kind == "kv" and not (a.metadata or {}).get("source_kv_asset_id")]
+    existing_base = [a for a in proj.assets_of_kind("kv") if not (a.metadata or {}).get("source_kv_asset_id")]
     base_start = len(existing_base)
-    for idx, gi in enumerate(images):
-        label = f"kv_option_{base_start + idx + 1}"
-        buf = _pil_to_png_bytes(gi.image)
-        asset = store.add_asset(
-            project_id=project_id,
-            kind="kv",
-            filename=f"{label}.png",
-            content=buf,
-            metadata={
-                "provider": gi.provider,
-                "model": gi.model,
-                "prompt": gi.prompt_used,
-                "display_name": label,
-            },
-            subdir="kvs",
-        )
-        kv_asset_ids.append(asset.asset_id)
+    async with store.async_transaction(project_id) as tx:
+        for idx, gi in enumerate(images):
+            label = f"kv_option_{base_start + idx + 1}"
+            buf = await run_blocking(_pil_to_png_bytes, gi.image)
+            asset = await run_blocking(
+                tx.add_asset,
+                kind="kv",
+                filename=f"{label}.png",
+                content=buf,
+                metadata={
+                    "provider": gi.provider,
+                    "model": gi.model,
+                    "prompt": gi.prompt_used,
+                    "display_name": label,
+                },
+            )
+            kv_asset_ids.append(asset.asset_id)
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "kv_generate",
@@ -980,58 +1390,60 @@ async def reframe_kv(
     n: int = Form(1),
     prompt: str = Form("Reframe this KV to the target aspect ratio and integrate the motif as a background brand element."),
 ):
-    proj = store.read_project(project_id)
-    kv_asset = next((a for a in proj.assets if a.asset_id == kv_asset_id and a.kind == "kv"), None)
+    proj = await run_blocking(store.read_project, project_id)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
     if not kv_asset:
         raise HTTPException(status_code=400, detail="kv_asset_id must be an existing KV asset")
 
-    motif_path: Path | None = None
-    if motif_asset_id:
-        motif_asset = next((a for a in proj.assets if a.asset_id == motif_asset_id and a.kind == "motif"), None)
-        if motif_asset:
-            motif_path = store.abs_asset_path(project_id, motif_asset)
+    motif_asset = proj.get_asset(motif_asset_id, "motif") if motif_asset_id else None
 
     kv_path = store.abs_asset_path(project_id, kv_asset)
+    # Decode the inputs and build the locked canvas off the event loop (as outpaint_layout does).
+    base_img = await run_blocking(_open_asset_image, project_id, kv_asset, "RGB")
+    locked_canvas = await run_blocking(_make_outpaint_canvas, base_img, aspect_ratio, seed=_canvas_seed(kv_asset))
+    motif_img = await run_blocking(_open_asset_image, project_id, motif_asset, "RGBA") if motif_asset else None
     gemini = _get_gemini()
 
     # Add strong constraints to reduce drift. If motif isn't provided, explicitly
     # instruct the model not to invent one.
-    sys_constraints = _build_reframe_constraints(motif_path is not None)
+    sys_constraints = _build_reframe_constraints(motif_img is not None)
 
     images = await gemini.reframe_kv_with_motif(
         kv_image=kv_path,
-        motif_image=motif_path,
+        motif_image=motif_img,
         prompt=f"{prompt}\n\n{sys_constraints}",
         aspect_ratio=aspect_ratio,
         image_size=image_size,
         n=int(n),
+        locked_canvas=locked_canvas,
     )
 
     kv_asset_ids: list[str] = []
-    for idx, gi in enumerate(images):
-        source_label = (kv_asset.metadata or {}).get("display_name") or kv_asset.filename
-        display_label = f"{source_label}_{aspect_ratio}_{idx + 1}"
-        buf = _pil_to_png_bytes(gi.image)
-        asset = store.add_asset(
-            project_id=project_id,
-            kind="kv",
-            filename=f"kv_reframe_{idx}.png",
-            content=buf,
-            metadata={
-                "provider": gi.provider,
-                "model": gi.model,
-                "prompt": gi.prompt_used,
-                "source_kv_asset_id": kv_asset_id,
-                "motif_asset_id": motif_asset_id or None,
-                "aspect_ratio": aspect_ratio,
-                "image_size": image_size,
-                "display_name": display_label,
-            },
-            subdir="kvs",
-        )
-        kv_asset_ids.append(asset.asset_id)
+    async with store.async_transaction(project_id) as tx:
+        for idx, gi in enumerate(images):
+            source_label = (kv_asset.metadata or {}).get("display_name") or kv_asset.filename
+            display_label = f"{source_label}_{aspect_ratio}_{idx + 1}"
+            buf = await run_blocking(_pil_to_png_bytes, gi.image)
+            asset = await run_blocking(
+                tx.add_asset,
+                kind="kv",
+                filename=f"kv_reframe_{idx}.png",
+                content=buf,
+                metadata={
+                    "provider": gi.provider,
+                    "model": gi.model,
+                    "prompt": gi.prompt_used,
+                    "source_kv_asset_id": kv_asset_id,
+                    "motif_asset_id": motif_asset_id or None,
+                    "aspect_ratio": aspect_ratio,
+                    "image_size": image_size,
+                    "display_name": display_label,
+                },
+            )
+            kv_asset_ids.append(asset.asset_id)
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "kv_reframe",
@@ -1050,6 +1462,39 @@ async def reframe_kv(
     return RedirectResponse(url=f"/projects/{project_id}", status_code=303)
 
 
+async def _render_draft_preview(
+    renderer: str,
+    kv_ref: ImageRef,
+    element_refs: tuple[ElementRef, ...],
+    render_options: dict[str, Any],
+    guide_ratio: str,
+    draft_scale: str,
+) -> Response:
+    """
+    Editor draft: the guide ratio only, scaled down and BILINEAR-filtered, returned as-is.
+    Nothing is persisted; "Generate previews" still renders and stores full-size masters.
+    """
+    ratio = guide_ratio if guide_ratio in settings.master_sizes else "1:1"
+    master_w, master_h = settings.master_sizes.get(ratio) or (1080, 1080)
+    scale = min(1.0, max(0.1, _parse_float(draft_scale or None, settings.draft_preview_scale)))
+    size = (max(1, round(master_w * scale)), max(1, round(master_h * scale)))
+    job = RenderJob(
+        renderer=renderer,
+        kv=kv_ref,
+        size=size,
+        options=render_options | {"resample": Image.Resampling.BILINEAR},
+        elements=element_refs,
+        encoder="draft",
+    )
+    (result,) = await render_executor.render([job])
+    encoded = result.encoded
+    return Response(
+        content=encoded.data,
+        media_type=encoded.media_type,
+        headers={"Cache-Control": "no-store", "X-Draft-Ratio": ratio, "X-Draft-Size": f"{size[0]}x{size[1]}"},
+    )
+
+
 @app.post("/projects/{project_id}/layouts/preview")
 async def preview_text_layout(
     project_id: str,
@@ -1079,15 +1524,14 @@ async def preview_text_layout(
     cta_w: str = Form("0.50"),
     cta_h: str = Form("0.10"),
     return_to: str = Form(""),
+    draft: str = Form(""),
+    draft_scale: str = Form(""),
 ):
-    proj = store.read_project(project_id)
-    kv_asset = next((a for a in proj.assets if a.asset_id == kv_asset_id and a.kind == "kv"), None)
+    proj = await run_blocking(store.read_project, project_id)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
     if not kv_asset:
         raise HTTPException(status_code=400, detail="kv_asset_id must be an existing KV asset")
 
-    kv_path = store.abs_asset_path(project_id, kv_asset)
-    kv_img = Image.open(kv_path)
-
     layout_id = uuid.uuid4().hex[:12]
     use_layers = False
     layers_payload: list[dict] = []
@@ -1215,186 +1659,177 @@ async def preview_text_layout(
             "shapes": shapes_layout,
         }
 
-    proj_dir = Path(settings.data_dir) / "projects" / project_id
-    layouts_dir = proj_dir / "layouts"
-    layouts_dir.mkdir(parents=True, exist_ok=True)
-    (layouts_dir / f"layout_{layout_id}.json").write_text(json.dumps(layout, indent=2), "utf-8")
+    kv_ref = _image_ref(project_id, kv_asset, "RGB")
+    element_refs = _collect_element_refs(project_id, proj, elements_layout)
+    if use_layers:
+        renderer = "text_layers"
+        render_options: dict[str, Any] = {
+            "text_layers": layers_payload,
+            "font_family": font_family,
+            "text_color_hex": text_color,
+            "text_align": text_align,
+            "image_box": image_box_payload,
+            "shapes": shapes_layout,
+        }
+    else:
+        renderer = "text_layout"
+        render_options = {
+            "headline": headline,
+            "subhead": subhead,
+            "cta": cta,
+            "font_family": font_family,
+            "text_color_hex": text_color,
+            "headline_box": headline_box,
+            "subhead_box": subhead_box,
+            "cta_box": cta_box,
+            "text_align": text_align,
+            "font_scale": float(font_scale),
+            "image_box": image_box_payload,
+            "shapes": shapes_layout,
+        }
 
-    preview_ids: list[str] = []
-    ratio_layout_ids: dict[str, str] = {}
-    render_elements: list[dict] = []
-    if elements_layout:
-        for el in elements_layout:
-            asset_id = el.get("asset_id")
-            if not asset_id:
-                continue
-            asset = next(
-                (a for a in proj.assets if a.asset_id == asset_id and a.kind in ("element", "motif", "product")),
-                None,
-            )
-            if not asset:
-                continue
-            path = store.abs_asset_path(project_id, asset)
-            if not path.exists():
-                continue
-            try:
-                img = Image.open(path).convert("RGBA")
-            except Exception:
-                continue
-            render_elements.append(
-                {
-                    "image": img,
-                    "box": el.get("box"),
-                    "opacity": el.get("opacity", 1),
-                }
-            )
+    if _parse_bool(draft):
+        return await _render_draft_preview(renderer, kv_ref, element_refs, render_options, guide_ratio, draft_scale)
 
-    for ratio in ("1:1", "4:5", "9:16"):
-        size = settings.master_sizes.get(ratio)
-        if not size:
-            continue
-        ratio_layout_id = uuid.uuid4().hex[:12]
-        ratio_layout_ids[ratio] = ratio_layout_id
-        if use_layers:
-            ratio_layout = {
-                "layout_id": ratio_layout_id,
-                "layout_kind": "ratio",
-                "source_layout_id": layout_id,
-                "ratio": ratio,
-                "kv_asset_id": kv_asset_id,
-                "guide_ratio": ratio,
-                "font_family": font_family,
-                "text_color": text_color,
-                "text_align": text_align,
-                "image_box": image_box_payload,
-                "text_layers": layers_payload,
-                "elements": elements_layout,
-                "shapes": shapes_layout,
-            }
-        else:
-            ratio_layout = {
-                "layout_id": ratio_layout_id,
-                "layout_kind": "ratio",
-                "source_layout_id": layout_id,
-                "ratio": ratio,
-                "kv_asset_id": kv_asset_id,
-                "guide_ratio": ratio,
-                "headline": headline,
-                "subhead": subhead,
-                "cta": cta,
-                "font_family": font_family,
-                "text_color": text_color,
-                "text_align": text_align,
-                "headline_box": headline_box,
-                "subhead_box": subhead_box,
-                "cta_box": cta_box,
-                "image_box": image_box_payload,
-                "elements": elements_layout,
-                "shapes": shapes_layout,
-            }
-        (layouts_dir / f"layout_{ratio_layout_id}.json").write_text(json.dumps(ratio_layout, indent=2), "utf-8")
+    layouts_dir = Path(settings.data_dir) / "projects" / project_id / "layouts"
+    await run_blocking(_write_json, layouts_dir / f"layout_{layout_id}.json", layout)
 
-        if use_layers:
-            rendered = render_text_layers(
-                kv=kv_img,
-                size=size,
-                text_layers=layers_payload,
-                font_family=font_family,
-                text_color_hex=text_color,
-                text_align=text_align,
-                image_box=image_box_payload,
-                elements=render_elements,
-                shapes=shapes_layout,
-            )
-        else:
-            rendered = render_text_layout(
-                kv=kv_img,
+    preview_ids: list[str] = []
+    ratio_layout_ids: dict[str, str] = {}
+    ratio_layouts: list[dict[str, Any]] = []
+    ratio_sizes = [(r, settings.master_sizes[r]) for r in ("1:1", "4:5", "9:16") if settings.master_sizes.get(r)]
+    # All ratios render concurrently; results come back in ratio order.
+    results = await render_executor.render(
+        [
+            RenderJob(
+                renderer=renderer,
+                kv=kv_ref,
                 size=size,
-                headline=headline,
-                subhead=subhead,
-                cta=cta,
-                font_family=font_family,
-                text_color_hex=text_color,
-                headline_box=headline_box,
-                subhead_box=subhead_box,
-                cta_box=cta_box,
-                text_align=text_align,
-                font_scale=float(font_scale),
-                image_box=image_box_payload,
-                elements=render_elements,
-                shapes=shapes_layout,
+                options=render_options,
+                elements=element_refs,
+                encoder="text_preview",
             )
-        out_bytes = _pil_to_png_bytes(rendered.image)
-        label = (kv_asset.metadata or {}).get("display_name") or kv_asset.filename
-        debug_render_layers: list[dict] | None = None
-        if use_layers:
-            debug_render_layers = []
-            for layer in layers_payload:
-                if not isinstance(layer, dict):
-                    continue
-                box = layer.get("box") if isinstance(layer.get("box"), dict) else {}
-                try:
-                    x = float(box.get("x", 0))
-                    y = float(box.get("y", 0))
-                    w = float(box.get("w", 0))
-                    h = float(box.get("h", 0))
-                except (TypeError, ValueError):
-                    continue
-                x1 = max(0, int(x * size[0]))
-                y1 = max(0, int(y * size[1]))
-                x2 = min(size[0], int((x + w) * size[0]))
-                y2 = min(size[1], int((y + h) * size[1]))
-                box_h = max(1, y2 - y1)
-                font_px = None
-                if layer.get("font_size_box_norm") is not None:
-                    try:
-                        font_px = float(layer.get("font_size_box_norm")) * box_h
-                    except (TypeError, ValueError):
-                        font_px = None
-                if font_px is None and layer.get("font_size_norm") is not None:
+            for _, size in ratio_sizes
+        ]
+    )
+
+    async with store.async_transaction(project_id) as tx:
+        for (ratio, size), result in zip(ratio_sizes, results):
+            ratio_layout_id = uuid.uuid4().hex[:12]
+            ratio_layout_ids[ratio] = ratio_layout_id
+            if use_layers:
+                ratio_layout = {
+                    "layout_id": ratio_layout_id,
+                    "layout_kind": "ratio",
+                    "source_layout_id": layout_id,
+                    "ratio": ratio,
+                    "kv_asset_id": kv_asset_id,
+                    "guide_ratio": ratio,
+                    "font_family": font_family,
+                    "text_color": text_color,
+                    "text_align": text_align,
+                    "image_box": image_box_payload,
+                    "text_layers": layers_payload,
+                    "elements": elements_layout,
+                    "shapes": shapes_layout,
+                }
+            else:
+                ratio_layout = {
+                    "layout_id": ratio_layout_id,
+                    "layout_kind": "ratio",
+                    "source_layout_id": layout_id,
+                    "ratio": ratio,
+                    "kv_asset_id": kv_asset_id,
+                    "guide_ratio": ratio,
+                    "headline": headline,
+                    "subhead": subhead,
+                    "cta": cta,
+                    "font_family": font_family,
+                    "text_color": text_color,
+                    "text_align": text_align,
+                    "headline_box": headline_box,
+                    "subhead_box": subhead_box,
+                    "cta_box": cta_box,
+                    "image_box": image_box_payload,
+                    "elements": elements_layout,
+                    "shapes": shapes_layout,
+                }
+            ratio_layouts.append(ratio_layout)
+
+            out_bytes = result.encoded.data
+            label = (kv_asset.metadata or {}).get("display_name") or kv_asset.filename
+            debug_render_layers: list[dict] | None = None
+            if use_layers:
+                debug_render_layers = []
+                for layer in layers_payload:
+                    if not isinstance(layer, dict):
+                        continue
+                    box = layer.get("box") if isinstance(layer.get("box"), dict) else {}
                     try:
-                        font_px = float(layer.get("font_size_norm")) * size[0]
+                        x = float(box.get("x", 0))
+                        y = float(box.get("y", 0))
+                        w = float(box.get("w", 0))
+                        h = float(box.get("h", 0))
                     except (TypeError, ValueError):
-                        font_px = None
-                debug_render_layers.append(
-                    {
-                        "text": layer.get("text"),
-                        "box_norm": {"x": x, "y": y, "w": w, "h": h},
-                        "box_px": {"x1": x1, "y1": y1, "x2": x2, "y2": y2},
-                        "font_px": font_px,
-                        "font_size_box_norm": layer.get("font_size_box_norm"),
-                        "font_size_norm": layer.get("font_size_norm"),
-                    }
-                )
-
-        asset = store.add_asset(
-            project_id=project_id,
-            kind="text_preview",
-            filename=f"text_preview_{label}_{ratio.replace(':','x')}.png",
-            content=out_bytes,
-            metadata={
-                "ratio": ratio,
-                "kv_asset_id": kv_asset_id,
-                "layout_id": layout_id,
-                "ratio_layout_id": ratio_layout_ids.get(ratio),
-                "font_family": font_family,
-                "text_color": text_color,
-                "text_align": text_align,
-                "text_layers": len(layers_payload) if use_layers else None,
-                "headline": headline if not use_layers else None,
-                "subhead": subhead if not use_layers else None,
-                "cta": cta if not use_layers else None,
-                "debug_text_layers": layers_payload if use_layers else None,
-                "debug_render_layers": debug_render_layers,
-                "debug_elements": elements_layout or None,
-                "debug_image_box": image_box_payload,
-                "debug_guide_ratio": guide_ratio or None,
-            },
-            subdir="text_previews",
-        )
-        preview_ids.append(asset.asset_id)
+                        continue
+                    x1 = max(0, int(x * size[0]))
+                    y1 = max(0, int(y * size[1]))
+                    x2 = min(size[0], int((x + w) * size[0]))
+                    y2 = min(size[1], int((y + h) * size[1]))
+                    box_h = max(1, y2 - y1)
+                    font_px = None
+                    if layer.get("font_size_box_norm") is not None:
+                        try:
+                            font_px = float(layer.get("font_size_box_norm")) * box_h
+                        except (TypeError, ValueError):
+                            font_px = None
+                    if font_px is None and layer.get("font_size_norm") is not None:
+                        try:
+                            font_px = float(layer.get("font_size_norm")) * size[0]
+                        except (TypeError, ValueError):
+                            font_px = None
+                    debug_render_layers.append(
+                        {
+                            "text": layer.get("text"),
+                            "box_norm": {"x": x, "y": y, "w": w, "h": h},
+                            "box_px": {"x1": x1, "y1": y1, "x2": x2, "y2": y2},
+                            "font_px": font_px,
+                            "font_size_box_norm": layer.get("font_size_box_norm"),
+                            "font_size_norm": layer.get("font_size_norm"),
+                        }
+                    )
+
+            asset = await run_blocking(
+                tx.add_asset,
+                kind="text_preview",
+                filename=f"text_preview_{label}_{ratio.replace(':','x')}.png",
+                content=out_bytes,
+                metadata={
+                    "ratio": ratio,
+                    "kv_asset_id": kv_asset_id,
+                    "layout_id": layout_id,
+                    "ratio_layout_id": ratio_layout_ids.get(ratio),
+                    "font_family": font_family,
+                    "text_color": text_color,
+                    "text_align": text_align,
+                    "text_layers": len(layers_payload) if use_layers else None,
+                    "headline": headline if not use_layers else None,
+                    "subhead": subhead if not use_layers else None,
+                    "cta": cta if not use_layers else None,
+                    "debug_text_layers": layers_payload if use_layers else None,
+                    "debug_render_layers": debug_render_layers,
+                    "debug_elements": elements_layout or None,
+                    "debug_image_box": image_box_payload,
+                    "debug_guide_ratio": guide_ratio or None,
+                },
+            )
+            preview_ids.append(asset.asset_id)
+    # Written only after the commit, so a rolled-back preview leaves no layouts referenced by missing assets.
+    for ratio_layout in ratio_layouts:
+        await run_blocking(_write_json, layouts_dir / f"layout_{ratio_layout['layout_id']}.json", ratio_layout)
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "layout_preview",
@@ -1409,6 +1844,7 @@ async def preview_text_layout(
                 "elements": len(elements_payload),
             },
             "outputs": {"preview_asset_ids": preview_ids, "ratio_layout_ids": ratio_layout_ids},
+            "encoding": {ratio: result.encoded.stats() for (ratio, _), result in zip(ratio_sizes, results)},
         },
     )
 
@@ -1423,8 +1859,8 @@ async def generate_headlines(
     count: int = Form(10),
     use_images: bool = Form(False),
 ):
-    proj = store.read_project(project_id)
-    ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets if a.kind in ("reference", "product", "kv")]
+    proj = await run_blocking(store.read_project, project_id)
+    ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets_of_kind("reference", "product", "kv")]
 
     # Optionally enrich the brief with brand-language cues extracted from images.
     context_text = ""
@@ -1443,7 +1879,8 @@ async def generate_headlines(
     openai = _get_openai_text()
     lines = await openai.generate_copy(brief_text=full_brief, count=int(count))
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "copy_headlines",
@@ -1456,7 +1893,7 @@ async def generate_headlines(
 
     # Persist as a plain json file in the project for easy UI access in v0.
     proj_dir = Path(settings.data_dir) / "projects" / project_id
-    (proj_dir / "copy_headlines.json").write_text(json.dumps({"headlines": lines}, indent=2), "utf-8")
+    await run_blocking(_write_json, proj_dir / "copy_headlines.json", {"headlines": lines})
     return RedirectResponse(url=f"/projects/{project_id}", status_code=303)
 
 
@@ -1468,8 +1905,8 @@ async def generate_copy_sets(
     use_images: bool = Form(False),
     return_to: str = Form(""),
 ):
-    proj = store.read_project(project_id)
-    ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets if a.kind in ("reference", "product", "kv")]
+    proj = await run_blocking(store.read_project, project_id)
+    ref_paths = [store.abs_asset_path(project_id, a) for a in proj.assets_of_kind("reference", "product", "kv")]
 
     context_text = ""
     if use_images and ref_paths:
@@ -1487,7 +1924,8 @@ async def generate_copy_sets(
     openai = _get_openai_text()
     sets = await openai.generate_copy_sets(brief_text=full_brief, count=int(count))
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "copy_sets",
@@ -1499,7 +1937,7 @@ async def generate_copy_sets(
     )
 
     proj_dir = Path(settings.data_dir) / "projects" / project_id
-    (proj_dir / "copy_sets.json").write_text(json.dumps({"sets": sets}, indent=2), "utf-8")
+    await run_blocking(_write_json, proj_dir / "copy_sets.json", {"sets": sets})
 
     redirect_path = _safe_return_path(return_to) or f"/projects/{project_id}/editor"
     return RedirectResponse(url=redirect_path, status_code=303)
@@ -1550,62 +1988,67 @@ async def build_masters(
     motif_position: str = Form("right"),
     subject_position: str = Form("right"),
 ):
-    proj = store.read_project(project_id)
+    proj = await run_blocking(store.read_project, project_id)
     use_headline = (headline_select or "").strip() or (headline or "").strip()
     if not use_headline:
         raise HTTPException(status_code=400, detail="headline is required (type one or select one)")
-    kv_asset = next((a for a in proj.assets if a.asset_id == kv_asset_id and a.kind == "kv"), None)
+    kv_asset = proj.get_asset(kv_asset_id, "kv")
     if not kv_asset:
         raise HTTPException(status_code=400, detail="kv_asset_id must be an existing KV asset")
 
-    kv_path = store.abs_asset_path(project_id, kv_asset)
-    kv_img = Image.open(kv_path)
-
-    motif_img = None
+    motif_ref = None
     if motif_asset_id:
-        motif_asset = next((a for a in proj.assets if a.asset_id == motif_asset_id and a.kind == "motif"), None)
+        motif_asset = proj.get_asset(motif_asset_id, "motif")
         if motif_asset:
-            motif_path = store.abs_asset_path(project_id, motif_asset)
-            try:
-                motif_img = Image.open(motif_path)
-            except Exception:
-                motif_img = None
+            motif_ref = _image_ref(project_id, motif_asset)
+
+    render_options = {
+        "headline": use_headline,
+        "cta": cta,
+        "motif_opacity": float(motif_opacity),
+        "motif_tint_hex": motif_tint_hex,
+        "motif_position": motif_position,
+        "subject_position": subject_position,
+    }
+    ratio_sizes = list(settings.master_sizes.items())
+    results = await render_executor.render(
+        [
+            RenderJob(
+                renderer="master_simple",
+                kv=_image_ref(project_id, kv_asset, "RGB"),
+                size=size,
+                options=render_options,
+                motif=motif_ref,
+            )
+            for _, size in ratio_sizes
+        ]
+    )
 
     master_ids: list[str] = []
-    for ratio, size in settings.master_sizes.items():
-        rendered = render_master_simple(
-            kv=kv_img,
-            size=size,
-            headline=use_headline,
-            cta=cta,
-            motif=motif_img,
-            motif_opacity=float(motif_opacity),
-            motif_tint_hex=motif_tint_hex,
-            motif_position=motif_position,
-            subject_position=subject_position,
-        )
-        out_bytes = _pil_to_png_bytes(rendered.image)
-        asset = store.add_asset(
-            project_id=project_id,
-            kind="master",
-            filename=f"master_{ratio.replace(':','x')}.png",
-            content=out_bytes,
-            metadata={
-                "ratio": ratio,
-                "kv_asset_id": kv_asset_id,
-                "headline": use_headline,
-                "cta": cta,
-                "motif_asset_id": motif_asset_id or None,
-                "motif_opacity": float(motif_opacity),
-                "motif_tint_hex": motif_tint_hex,
-                "motif_position": motif_position,
-                "subject_position": subject_position,
-            },
-            subdir="masters",
-        )
-        master_ids.append(asset.asset_id)
+    async with store.async_transaction(project_id) as tx:
+        for (ratio, size), result in zip(ratio_sizes, results):
+            out_bytes = result.encoded.data
+            asset = await run_blocking(
+                tx.add_asset,
+                kind="master",
+                filename=f"master_{ratio.replace(':','x')}.png",
+                content=out_bytes,
+                metadata={
+                    "ratio": ratio,
+                    "kv_asset_id": kv_asset_id,
+                    "headline": use_headline,
+                    "cta": cta,
+                    "motif_asset_id": motif_asset_id or None,
+                    "motif_opacity": float(motif_opacity),
+                    "motif_tint_hex": motif_tint_hex,
+                    "motif_position": motif_position,
+                    "subject_position": subject_position,
+                },
+            )
+            master_ids.append(asset.asset_id)
 
-    store.write_run_manifest(
+    await run_blocking(
+        store.write_run_manifest,
         project_id,
         {
             "type": "masters_build",
@@ -1613,14 +2056,11 @@ async def build_masters(
             "model": "render_master_simple",
             "inputs": {"kv_asset_id": kv_asset_id, "headline": headline, "cta": cta},
             "outputs": {"master_asset_ids": master_ids},
+            "encoding": {ratio: result.encoded.stats() for (ratio, _), result in zip(ratio_sizes, results)},
         },
     )
     return RedirectResponse(url=f"/projects/{project_id}", status_code=303)
 
 
 def _pil_to_png_bytes(img: Image.Image) -> bytes:
-    import io
-
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    return buf.getvalue()
+    return encode_image(img, "png").data
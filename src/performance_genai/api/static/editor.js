@@ -66,6 +66,8 @@
   var alignSelect = document.getElementById("align-select");
   var guideSelect = document.getElementById("guide-select");
   var btnPreview = document.getElementById("btn-preview");
+  var btnDraftPreview = document.getElementById("btn-draft-preview");
+  var draftPreviewImg = document.getElementById("draft-preview-img");
   var btnInsertText = document.getElementById("btn-insert-text");
   var btnUndo = document.getElementById("btn-undo");
   var btnDeleteText = document.getElementById("btn-delete-text");
@@ -1476,6 +1478,34 @@
     }
   }
 
+  function collectAndDraft() {
+    if (!select.value) return;
+    saveState();
+    populateLayoutFormFields("form");
+    setHidden("form-font-scale", fontScale.toFixed(3));
+    var form = document.getElementById("preview-form");
+    if (!form || !draftPreviewImg) return;
+    var body = new FormData(form);
+    body.append("draft", "1");
+    btnDraftPreview.disabled = true;
+    fetch(form.action, { method: "POST", body: body })
+      .then(function (res) {
+        if (!res.ok) throw new Error("draft preview failed: " + res.status);
+        return res.blob();
+      })
+      .then(function (blob) {
+        if (draftPreviewImg.src) URL.revokeObjectURL(draftPreviewImg.src);
+        draftPreviewImg.src = URL.createObjectURL(blob);
+        draftPreviewImg.style.display = "block";
+      })
+      .catch(function (err) {
+        log(String(err));
+      })
+      .then(function () {
+        btnDraftPreview.disabled = false;
+      });
+  }
+
   function collectAndExportCurrent() {
     if (!select.value) return;
     saveState();
@@ -2026,6 +2056,9 @@
     });
   }
   btnPreview.addEventListener("click", collectAndSubmit);
+  if (btnDraftPreview) {
+    btnDraftPreview.addEventListener("click", collectAndDraft);
+  }
   if (btnExportCurrent) {
     btnExportCurrent.addEventListener("click", collectAndExportCurrent);
   }
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import numpy as np
+from PIL import Image
+
+# Outpaint margins: mid-gray with sparse light noise so the model doesn't treat them as
+# "intentional black bars". Roughly 0.2% of pixels get a value in 120..140.
+_NOISE_BASE = 128
+_NOISE_DENSITY = 0.002
+_NOISE_RANGE = (120, 140)
+
+
+def noise_canvas(size: tuple[int, int], seed: int | None = None) -> Image.Image:
+    """
+    RGB canvas of the given size filled with the outpaint noise pattern, generated in one
+    array pass. The same seed always yields the same canvas.
+    """
+    tw, th = size
+    arr = np.full((th, tw), _NOISE_BASE, dtype=np.uint8)
+    count = int(tw * th * _NOISE_DENSITY)
+    if count > 0:
+        rng = np.random.default_rng(seed)
+        idx = rng.integers(0, tw * th, size=count)
+        arr.reshape(-1)[idx] = rng.integers(_NOISE_RANGE[0], _NOISE_RANGE[1] + 1, size=count, dtype=np.uint8)
+    return Image.fromarray(arr, mode="L").convert("RGB")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from PIL import Image
+
+# format query value -> (Pillow format, media type)
+DERIVATIVE_FORMATS: dict[str, tuple[str, str]] = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+    "png": ("PNG", "image/png"),
+}
+
+# Requested widths snap up to one of these so the cache holds a few sizes per asset, not one per pixel.
+DERIVATIVE_WIDTHS = (160, 320, 640, 1280, 2048)
+
+
+def normalize_derivative_format(fmt: str | None) -> str | None:
+    f = (fmt or "webp").strip().lower()
+    if f == "jpg":
+        f = "jpeg"
+    return f if f in DERIVATIVE_FORMATS else None
+
+
+def snap_derivative_width(width: int | None) -> int | None:
+    if width is None or width <= 0:
+        return None
+    for w in DERIVATIVE_WIDTHS:
+        if width <= w:
+            return w
+    return DERIVATIVE_WIDTHS[-1]
+
+
+def render_derivative(src: Path, width: int | None, fmt: str) -> bytes:
+    """
+    Downscale (never upscale) an image file to `width` and re-encode it for display.
+    """
+    pil_format, _ = DERIVATIVE_FORMATS[fmt]
+    with Image.open(src) as img:
+        img.load()
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+        out = img.convert("RGBA" if has_alpha and pil_format != "JPEG" else "RGB")
+    if width and out.width > width:
+        # thumbnail() pre-reduces with Image.reduce before the final LANCZOS pass.
+        out.thumbnail((width, out.height), Image.Resampling.LANCZOS)
+
+    buf = io.BytesIO()
+    if pil_format == "PNG":
+        out.save(buf, format="PNG", compress_level=3)
+    elif pil_format == "WEBP":
+        out.save(buf, format="WEBP", quality=80, method=4)
+    else:
+        out.save(buf, format="JPEG", quality=82, optimize=True)
+    return buf.getvalue()
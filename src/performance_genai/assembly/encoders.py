@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import io
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    """
+    How a rendered image is written out. Lossy profiles honour a byte cap by searching
+    quality downwards from `quality` to `min_quality`.
+    """
+
+    name: str
+    format: str
+    media_type: str
+    extension: str
+    params: dict[str, Any] = field(default_factory=dict)
+    quality: int | None = None
+    min_quality: int = 50
+
+
+ENCODER_PROFILES: dict[str, EncoderProfile] = {
+    # Internal previews are re-rendered on export; favour encode speed over size.
+    "text_preview": EncoderProfile("text_preview", "PNG", "image/png", "png", {"compress_level": 1}),
+    # Throwaway editor drafts: fastest baseline JPEG, never stored.
+    "draft": EncoderProfile("draft", "JPEG", "image/jpeg", "jpg", {}, quality=80),
+    # Lossless deliverables (masters, PNG exports): Pillow's default zlib level.
+    "png": EncoderProfile("png", "PNG", "image/png", "png", {"compress_level": 6}),
+    "webp": EncoderProfile("webp", "WEBP", "image/webp", "webp", {"method": 4}, quality=90),
+    "jpeg": EncoderProfile(
+        "jpeg", "JPEG", "image/jpeg", "jpg", {"optimize": True, "progressive": True}, quality=90
+    ),
+}
+
+EXPORT_FORMATS = ("png", "webp", "jpeg")
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    data: bytes
+    profile: str
+    media_type: str
+    extension: str
+    encode_ms: float
+    quality: int | None = None
+
+    def stats(self) -> dict[str, Any]:
+        """Manifest-friendly summary."""
+        return {
+            "profile": self.profile,
+            "bytes": len(self.data),
+            "encode_ms": round(self.encode_ms, 1),
+            "quality": self.quality,
+        }
+
+
+def resolve_export_profile(export_format: str | None) -> EncoderProfile:
+    fmt = (export_format or "png").strip().lower()
+    if fmt == "jpg":
+        fmt = "jpeg"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"export_format must be one of: {', '.join(EXPORT_FORMATS)}")
+    return ENCODER_PROFILES[fmt]
+
+
+def encode_image(img: Image.Image, profile: EncoderProfile | str, max_bytes: int | None = None) -> EncodedImage:
+    if isinstance(profile, str):
+        profile = ENCODER_PROFILES[profile]
+    if profile.format == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    started = time.perf_counter()
+    if profile.quality is None:
+        data, quality = _save(img, profile, None), None
+    else:
+        data, quality = _encode_with_cap(img, profile, max_bytes)
+    return EncodedImage(
+        data=data,
+        profile=profile.name,
+        media_type=profile.media_type,
+        extension=profile.extension,
+        encode_ms=(time.perf_counter() - started) * 1000,
+        quality=quality,
+    )
+
+
+def _encode_with_cap(img: Image.Image, profile: EncoderProfile, max_bytes: int | None) -> tuple[bytes, int]:
+    hi = int(profile.quality or 90)
+    data = _save(img, profile, hi)
+    if not max_bytes or len(data) <= max_bytes:
+        return data, hi
+    # Highest quality under the cap; size is (near enough) monotonic in quality.
+    lo = profile.min_quality
+    best = _save(img, profile, lo)
+    if len(best) > max_bytes:
+        return best, lo  # Can't meet the cap; return the smallest acceptable encode.
+    best_q = lo
+    hi -= 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        candidate = _save(img, profile, mid)
+        if len(candidate) <= max_bytes:
+            best, best_q, lo = candidate, mid, mid
+        else:
+            hi = mid - 1
+    return best, best_q
+
+
+def _save(img: Image.Image, profile: EncoderProfile, quality: int | None) -> bytes:
+    params = dict(profile.params)
+    if quality is not None:
+        params["quality"] = quality
+    buf = io.BytesIO()
+    img.save(buf, format=profile.format, **params)
+    return buf.getvalue()
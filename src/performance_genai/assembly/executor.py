@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from performance_genai.assembly.encoders import EncodedImage, encode_image
+from performance_genai.assembly.render import (
+    pyramid_cache_info,
+    render_master_simple,
+    render_text_layout,
+    set_pyramid_cache_max_bytes,
+)
+from performance_genai.assembly.scene import render_text_layers
+from performance_genai.execution import run_blocking
+from performance_genai.image_cache import DecodedImageCache
+
+
+@dataclass(frozen=True)
+class ImageRef:
+    """Picklable pointer to an asset's pixels; whoever renders decodes it through its own cache."""
+
+    sha256: str
+    path: str
+    mode: str | None = None
+
+
+@dataclass(frozen=True)
+class ElementRef:
+    image: ImageRef
+    box: Any
+    opacity: Any = 1
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """
+    One ratio render: renderer name, KV, target size, the renderer's keyword arguments and
+    the encoder profile for the output. Everything is plain data so jobs can cross process
+    boundaries.
+    """
+
+    renderer: str
+    kv: ImageRef
+    size: tuple[int, int]
+    options: dict[str, Any] = field(default_factory=dict)
+    elements: tuple[ElementRef, ...] = ()
+    motif: ImageRef | None = None
+    encoder: str = "png"
+    max_bytes: int | None = None
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    encoded: EncodedImage
+    scrim_applied: bool
+
+
+_RENDERERS = {
+    "text_layers": render_text_layers,
+    "text_layout": render_text_layout,
+    "master_simple": render_master_simple,
+}
+
+
+def run_render_job(job: RenderJob, images: DecodedImageCache) -> RenderResult:
+    """Render and encode one job in the current process."""
+    kv = images.open(job.kv.sha256, Path(job.kv.path), job.kv.mode)
+    kwargs = dict(job.options)
+    if job.renderer == "master_simple":
+        kwargs["motif"] = _open_optional(images, job.motif)
+    else:
+        elements: list[dict] = []
+        for el in job.elements:
+            img = _open_optional(images, el.image)
+            if img is not None:
+                elements.append({"image": img, "box": el.box, "opacity": el.opacity})
+        kwargs["elements"] = elements
+    rendered = _RENDERERS[job.renderer](kv=kv, size=job.size, **kwargs)
+    encoded = encode_image(rendered.image, job.encoder, max_bytes=job.max_bytes)
+    return RenderResult(encoded=encoded, scrim_applied=rendered.scrim_applied)
+
+
+def _open_optional(images: DecodedImageCache, ref: ImageRef | None):
+    # Unreadable elements/motifs are skipped, as the sequential render paths always did.
+    if ref is None:
+        return None
+    try:
+        return images.open(ref.sha256, Path(ref.path), ref.mode)
+    except Exception:
+        return None
+
+
+# Per worker process: decoded inputs (and their resample pyramids) survive across jobs.
+_worker_images: DecodedImageCache | None = None
+
+
+def _init_worker(cache_max_bytes: int, pyramid_max_bytes: int) -> None:
+    global _worker_images
+    _worker_images = DecodedImageCache(cache_max_bytes)
+    set_pyramid_cache_max_bytes(pyramid_max_bytes)
+
+
+def _render_in_worker(job: RenderJob) -> RenderResult:
+    assert _worker_images is not None
+    return run_render_job(job, _worker_images)
+
+
+def default_render_workers() -> int:
+    # A single core gains nothing from a pool but pays for pickling and process start-up.
+    cpus = os.cpu_count() or 1
+    return min(4, cpus) if cpus > 1 else 0
+
+
+class RenderExecutor:
+    """
+    Renders the ratio variants of one request in parallel on a process pool.
+
+    workers=0 (or a single job) renders in-process, on the blocking executor and against the
+    caller's image cache; a broken pool is discarded and the batch is retried in-process.
+    Each worker decodes into its own cache sized like the caller's (images.max_bytes) and gets
+    the caller's pyramid budget, so the caller should set both to its share of the total.
+    """
+
+    def __init__(self, workers: int, images: DecodedImageCache) -> None:
+        self.workers = max(0, int(workers))
+        self.images = images
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    async def render(self, jobs: list[RenderJob]) -> list[RenderResult]:
+        if self.workers <= 0 or len(jobs) <= 1:
+            return await self._render_local(jobs)
+        pool = self._get_pool()
+        loop = asyncio.get_running_loop()
+        try:
+            return list(await asyncio.gather(*(loop.run_in_executor(pool, _render_in_worker, job) for job in jobs)))
+        except BrokenProcessPool:
+            self._discard_pool(pool)
+            return await self._render_local(jobs)
+
+    async def _render_local(self, jobs: list[RenderJob]) -> list[RenderResult]:
+        # Still off the event loop: in-process renders go to the shared blocking executor.
+        return list(await asyncio.gather(*(run_blocking(run_render_job, job, self.images) for job in jobs)))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn, not fork: the server process has threads (and locks) of its own.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.images.max_bytes, pyramid_cache_info()["max_bytes"]),
+                )
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 import math
+from pathlib import Path
+import threading
+import weakref
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 
@@ -31,7 +37,7 @@ def render_master_simple(
 
     This is intentionally "v0 ugly but works". Templates come next.
     """
-    base = _resize_contain(kv.convert("RGB"), size).convert("RGBA")
+    base = _resize_contain(kv, size, mode="RGB").convert("RGBA")
 
     if motif is not None:
         base = _apply_motif_overlay(
@@ -106,16 +112,18 @@ def render_text_layout(
     image_box: dict | None = None,
     elements: list[dict] | None = None,
     shapes: list[dict] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
 ) -> RenderedMaster:
     """
     Deterministic text overlay for editor previews.
     Boxes are normalized (x, y, w, h) in 0..1 coordinates.
+    `resample` filters the KV and elements; drafts trade LANCZOS for a cheaper filter.
     """
-    base = _render_base_image(kv, size, image_box=image_box)
+    base = _render_base_image(kv, size, image_box=image_box, resample=resample)
     if shapes:
         _apply_shapes(base, size, shapes)
     if elements:
-        _apply_elements(base, size, elements)
+        _apply_elements(base, size, elements, resample=resample)
     draw = ImageDraw.Draw(base)
 
     align = (text_align or "left").strip().lower()
@@ -168,151 +176,6 @@ def render_text_layout(
     return RenderedMaster(image=base.convert("RGB"), scrim_applied=True)
 
 
-def render_text_layers(
-    kv: Image.Image,
-    size: tuple[int, int],
-    text_layers: list[dict],
-    font_family: str,
-    text_color_hex: str,
-    text_align: str = "left",
-    image_box: dict | None = None,
-    elements: list[dict] | None = None,
-    shapes: list[dict] | None = None,
-) -> RenderedMaster:
-    """
-    Render multiple text boxes using absolute font sizes from the editor.
-    Each layer expects:
-      - text: string
-      - box: {x,y,w,h} normalized to 0..1
-      - font_size_norm: font px / canvas height
-      - font_family, color, align (optional overrides)
-    """
-    base = _render_base_image(kv, size, image_box=image_box)
-    if shapes:
-        _apply_shapes(base, size, shapes)
-    if elements:
-        _apply_elements(base, size, elements)
-    draw = ImageDraw.Draw(base)
-
-    default_align = (text_align or "left").strip().lower()
-    default_color = _hex_to_rgb(text_color_hex) + (255,)
-
-    for layer in text_layers or []:
-        if not isinstance(layer, dict):
-            continue
-        text = (layer.get("text_wrapped") or layer.get("text") or "").strip()
-        if not text:
-            continue
-        box = layer.get("box") or {}
-        try:
-            box_norm = (
-                float(box.get("x", 0)),
-                float(box.get("y", 0)),
-                float(box.get("w", 0)),
-                float(box.get("h", 0)),
-            )
-        except (TypeError, ValueError):
-            continue
-        px_box = _norm_box_to_px(box_norm, size)
-        if px_box is None:
-            continue
-        x1, y1, x2, y2 = px_box
-        max_w = max(1, x2 - x1)
-
-        font_px = None
-        if layer.get("font_px") is not None and layer.get("font_base_width"):
-            try:
-                font_px = float(layer.get("font_px")) * (size[0] / float(layer.get("font_base_width")))
-            except (TypeError, ValueError, ZeroDivisionError):
-                font_px = None
-        font_size_box_norm = layer.get("font_size_box_norm")
-        if font_px is not None:
-            font_px = max(10, int(font_px))
-        elif font_size_box_norm is not None:
-            try:
-                font_px = max(10, int(float(font_size_box_norm) * (y2 - y1)))
-            except (TypeError, ValueError):
-                font_px = max(12, int((y2 - y1) * 0.5))
-        else:
-            font_size_norm = layer.get("font_size_norm")
-            if font_size_norm is None:
-                font_px = max(12, int((y2 - y1) * 0.5))
-            else:
-                try:
-                    font_px = max(10, int(float(font_size_norm) * size[0]))
-                except (TypeError, ValueError):
-                    font_px = max(12, int((y2 - y1) * 0.5))
-
-        layer_font_family = layer.get("font_family") or font_family
-        font = _load_font(font_px, font_family=layer_font_family)
-        spacing = max(2, int(font_px * 0.18))
-        text_wrapped = layer.get("text_wrapped")
-        if isinstance(text_wrapped, str) and text_wrapped.strip():
-            wrapped = text_wrapped
-        else:
-            wrapped = _wrap_to_width(draw, text, font, max_w)
-
-        align = (layer.get("align") or default_align).strip().lower()
-        color_hex = layer.get("color") or text_color_hex
-        try:
-            text_color = _hex_to_rgb(color_hex) + (255,)
-        except Exception:
-            text_color = default_color
-
-        bg_color = layer.get("bg_color")
-        bg_opacity = layer.get("bg_opacity")
-        if bg_color and bg_opacity is not None:
-            try:
-                alpha = max(0, min(1, float(bg_opacity)))
-            except (TypeError, ValueError):
-                alpha = 0
-            if alpha > 0:
-                try:
-                    bg_rgb = _hex_to_rgb(bg_color)
-                except Exception:
-                    bg_rgb = (0, 0, 0)
-                bg_fill = bg_rgb + (int(alpha * 255),)
-                radius_px = 0
-                if layer.get("bg_radius_px") is not None and layer.get("bg_radius_base_width"):
-                    try:
-                        radius_px = float(layer.get("bg_radius_px")) * (size[0] / float(layer.get("bg_radius_base_width")))
-                    except (TypeError, ValueError, ZeroDivisionError):
-                        radius_px = 0
-                pad_px = 0
-                if layer.get("bg_padding_px") is not None and layer.get("bg_padding_base_width"):
-                    try:
-                        pad_px = float(layer.get("bg_padding_px")) * (size[0] / float(layer.get("bg_padding_base_width")))
-                    except (TypeError, ValueError, ZeroDivisionError):
-                        pad_px = 0
-                if pad_px <= 0:
-                    pad_px = max(4, min(24, font_px * 0.22))
-                x1p = max(0, int(x1 - pad_px))
-                y1p = max(0, int(y1 - pad_px))
-                x2p = min(size[0], int(x2 + pad_px))
-                y2p = min(size[1], int(y2 + pad_px))
-                radius_px = max(0, min(radius_px, min(x2p - x1p, y2p - y1p) / 2))
-                try:
-                    draw.rounded_rectangle((x1p, y1p, x2p, y2p), radius=radius_px, fill=bg_fill)
-                except Exception:
-                    draw.rectangle((x1p, y1p, x2p, y2p), fill=bg_fill)
-
-        tx = x1
-        if align in ("center", "right"):
-            try:
-                bbox = draw.multiline_textbbox((0, 0), wrapped, font=font, spacing=spacing)
-                tw = bbox[2] - bbox[0]
-            except Exception:
-                tw = 0
-            if align == "center":
-                tx = x1 + max(0, (max_w - tw) // 2)
-            else:
-                tx = x2 - tw
-
-        draw.multiline_text((tx, y1), wrapped, font=font, fill=text_color, spacing=spacing)
-
-    return RenderedMaster(image=base.convert("RGB"), scrim_applied=False)
-
-
 def _draw_multiline(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -328,36 +191,41 @@ def _draw_multiline(
     draw.multiline_text((x, y), text, font=font, fill=fill, spacing=spacing)
 
 
-def _resize_cover(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+def _resize_cover(img: Image.Image, size: tuple[int, int], mode: str | None = None) -> Image.Image:
     """
     Resize to cover the target canvas (no stretching), then center-crop.
     """
     tw, th = size
     iw, ih = img.size
     if iw <= 0 or ih <= 0:
-        return img.resize(size, Image.Resampling.LANCZOS)
+        return _resample(img, size, mode)
 
     scale = max(tw / iw, th / ih)
     nw, nh = int(iw * scale), int(ih * scale)
-    resized = img.resize((nw, nh), Image.Resampling.LANCZOS)
+    resized = _resample(img, (nw, nh), mode)
 
     left = max(0, (nw - tw) // 2)
     top = max(0, (nh - th) // 2)
     return resized.crop((left, top, left + tw, top + th))
 
 
-def _resize_contain(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+def _resize_contain(
+    img: Image.Image,
+    size: tuple[int, int],
+    mode: str | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> Image.Image:
     """
     Resize to fit inside the target canvas (no stretching), then center with padding.
     """
     tw, th = size
     iw, ih = img.size
     if iw <= 0 or ih <= 0:
-        return img.resize(size, Image.Resampling.LANCZOS)
+        return _resample(img, size, mode, resample)
 
     scale = min(tw / iw, th / ih)
     nw, nh = max(1, int(iw * scale)), max(1, int(ih * scale))
-    resized = img.resize((nw, nh), Image.Resampling.LANCZOS)
+    resized = _resample(img, (nw, nh), mode, resample)
     canvas = Image.new("RGBA", (tw, th), (0, 0, 0, 0))
     left = max(0, (tw - nw) // 2)
     top = max(0, (th - nh) // 2)
@@ -365,32 +233,181 @@ def _resize_contain(img: Image.Image, size: tuple[int, int]) -> Image.Image:
     return canvas
 
 
+# Pyramid levels are only used while they stay this many times larger than the target,
+# so the final LANCZOS pass still has enough source pixels to filter from.
+_PYRAMID_REDUCING_GAP = 1.5
+_PYRAMID_MODES = ("L", "RGB", "RGBA")
+
+# (id(source), mode) -> derived levels [converted full size if needed, 1/2, 1/4, ...].
+# The source itself is never stored, so entries die with it. Entries are LRU-ordered and
+# their bytes are counted against _pyramid_max_bytes (set_pyramid_cache_max_bytes).
+class _Pyramid:
+    __slots__ = ("build_lock", "derived", "nbytes")
+
+    def __init__(self) -> None:
+        # Held while converting/halving this source only; other images build concurrently.
+        self.build_lock = threading.Lock()
+        self.derived: list[Image.Image] = []
+        self.nbytes = 0  # guarded by _pyramid_lock
+
+
+_pyramids: OrderedDict[tuple[int, str], _Pyramid] = OrderedDict()
+_pyramid_sources: set[int] = set()
+# Guards the registry and byte totals only; never held while building levels.
+_pyramid_lock = threading.Lock()
+_pyramid_bytes = 0
+_pyramid_max_bytes = 256 * 1024 * 1024
+_pyramid_evictions = 0
+
+def _resample(
+    img: Image.Image,
+    size: tuple[int, int],
+    mode: str | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> Image.Image:
+    """
+    img.convert(mode).resize(size, resample), but resampled from the nearest level of a
+    cached half-resolution pyramid. Source images (e.g. from the decoded-image cache) are
+    long-lived, so each ratio render starts from a near-size copy instead of the original.
+    """
+    mode = mode or img.mode
+    tw, th = max(1, size[0]), max(1, size[1])
+    if mode not in _PYRAMID_MODES:
+        return img.convert(mode).resize((tw, th), resample)
+    levels = _pyramid_levels(img, mode, (tw, th))
+    src = levels[0]
+    for level in levels[1:]:
+        if level.width < tw * _PYRAMID_REDUCING_GAP or level.height < th * _PYRAMID_REDUCING_GAP:
+            break
+        src = level
+    return src.resize((tw, th), resample)
+
+
+def _pyramid_levels(img: Image.Image, mode: str, size: tuple[int, int]) -> list[Image.Image]:
+    key = (id(img), mode)
+    with _pyramid_lock:
+        entry = _pyramids.get(key)
+        if entry is None:
+            entry = _Pyramid()
+            _pyramids[key] = entry
+            if id(img) not in _pyramid_sources:
+                _pyramid_sources.add(id(img))
+                weakref.finalize(img, _drop_pyramids, id(img))
+        else:
+            _pyramids.move_to_end(key)
+
+    added = 0
+    with entry.build_lock:
+        derived = entry.derived
+        if not derived and img.mode != mode:
+            derived.append(img.convert(mode))
+            added += _pixel_bytes(derived[-1])
+        levels = [img, *derived] if img.mode == mode else list(derived)
+        # Extend lazily: only halve while the next level is still usable for this target.
+        while True:
+            last = levels[-1]
+            if last.width < 2 * size[0] * _PYRAMID_REDUCING_GAP or last.height < 2 * size[1] * _PYRAMID_REDUCING_GAP:
+                break
+            last = last.reduce(2)
+            levels.append(last)
+            derived.append(last)
+            added += _pixel_bytes(last)
+
+    if added:
+        _account_pyramid(key, entry, added)
+    return levels
+
+
+def _account_pyramid(key: tuple[int, str], entry: _Pyramid, added: int) -> None:
+    global _pyramid_bytes
+    with _pyramid_lock:
+        if _pyramids.get(key) is not entry:
+            return  # Evicted or dropped while building; callers still hold their levels.
+        entry.nbytes += added
+        _pyramid_bytes += added
+        _evict_pyramids_locked()
+
+
+def _evict_pyramids_locked() -> None:
+    global _pyramid_bytes, _pyramid_evictions
+    while _pyramid_bytes > _pyramid_max_bytes and _pyramids:
+        _, evicted = _pyramids.popitem(last=False)
+        _pyramid_bytes -= evicted.nbytes
+        _pyramid_evictions += 1
+
+
+def _drop_pyramids(source_id: int) -> None:
+    global _pyramid_bytes
+    with _pyramid_lock:
+        _pyramid_sources.discard(source_id)
+        for key in [k for k in _pyramids if k[0] == source_id]:
+            _pyramid_bytes -= _pyramids.pop(key).nbytes
+
+
+def _pixel_bytes(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
+
+
+def set_pyramid_cache_max_bytes(max_bytes: int) -> None:
+    """Byte budget for resample pyramids in this process (each render worker has its own)."""
+    global _pyramid_max_bytes
+    with _pyramid_lock:
+        _pyramid_max_bytes = max(0, int(max_bytes))
+        _evict_pyramids_locked()
+
+
+def pyramid_cache_info() -> dict[str, int]:
+    with _pyramid_lock:
+        return {
+            "entries": len(_pyramids),
+            "bytes": _pyramid_bytes,
+            "max_bytes": _pyramid_max_bytes,
+            "evictions": _pyramid_evictions,
+        }
+
+
 def _render_base_image(
     kv: Image.Image,
     size: tuple[int, int],
     image_box: dict | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
 ) -> Image.Image:
-    if not image_box:
-        return _resize_contain(kv.convert("RGB"), size).convert("RGBA")
+    return _place_kv(kv, size, _parse_image_box(image_box), resample=resample)
 
+
+def _parse_image_box(image_box: dict | None) -> tuple[float, float, float, float] | None:
+    """Normalized (x, y, w, h) of the KV, or None to contain-fit it on the canvas."""
+    if not image_box or not isinstance(image_box, dict):
+        return None
     try:
         x = float(image_box.get("x", 0))
         y = float(image_box.get("y", 0))
         w = float(image_box.get("w", 1))
         h = float(image_box.get("h", 1))
     except (TypeError, ValueError):
-        return _resize_contain(kv.convert("RGB"), size).convert("RGBA")
-
+        return None
     if w <= 0 or h <= 0:
-        return _resize_contain(kv.convert("RGB"), size).convert("RGBA")
+        return None
+    return (x, y, w, h)
+
 
+def _place_kv(
+    kv: Image.Image,
+    size: tuple[int, int],
+    box: tuple[float, float, float, float] | None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> Image.Image:
+    if box is None:
+        return _resize_contain(kv, size, mode="RGB", resample=resample).convert("RGBA")
+
+    x, y, w, h = box
     tw, th = size
     cx = x + (w / 2)
     cy = y + (h / 2)
 
     img_w, img_h = kv.size
     if img_w <= 0 or img_h <= 0:
-        return _resize_contain(kv.convert("RGB"), size).convert("RGBA")
+        return _resize_contain(kv, size, mode="RGB", resample=resample).convert("RGBA")
 
     # Keep image aspect ratio; use width as the primary scale reference.
     target_w = max(1, int(w * tw))
@@ -400,12 +417,17 @@ def _render_base_image(
     py = int((cy * th) - (target_h / 2))
 
     base = Image.new("RGBA", (tw, th), (0, 0, 0, 0))
-    resized = kv.convert("RGBA").resize((target_w, target_h), Image.Resampling.LANCZOS)
+    resized = _resample(kv, (target_w, target_h), mode="RGBA", resample=resample)
     base.paste(resized, (px, py), resized)
     return base
 
 
-def _apply_elements(base: Image.Image, size: tuple[int, int], elements: list[dict]) -> None:
+def _apply_elements(
+    base: Image.Image,
+    size: tuple[int, int],
+    elements: list[dict],
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> None:
     tw, th = size
     for el in elements:
         if not isinstance(el, dict):
@@ -432,7 +454,7 @@ def _apply_elements(base: Image.Image, size: tuple[int, int], elements: list[dic
         x1 = int((cx * tw) - (w_px / 2))
         y1 = int((cy * th) - (h_px / 2))
         try:
-            layer = img.resize((w_px, h_px), Image.Resampling.LANCZOS).convert("RGBA")
+            layer = _resample(img, (w_px, h_px), resample=resample).convert("RGBA")
         except Exception:
             continue
         opacity = el.get("opacity")
@@ -447,9 +469,19 @@ def _apply_elements(base: Image.Image, size: tuple[int, int], elements: list[dic
         base.paste(layer, (x1, y1), layer)
 
 
+@dataclass(frozen=True)
+class ShapeOp:
+    shape: str
+    box: tuple[float, float, float, float]
+    fill: tuple[int, int, int, int]
+
+
 def _apply_shapes(base: Image.Image, size: tuple[int, int], shapes: list[dict]) -> None:
-    tw, th = size
-    draw = ImageDraw.Draw(base, "RGBA")
+    _draw_shapes(base, size, _compile_shapes(shapes))
+
+
+def _compile_shapes(shapes: list[dict]) -> tuple[ShapeOp, ...]:
+    ops: list[ShapeOp] = []
     for shape in shapes:
         if not isinstance(shape, dict):
             continue
@@ -462,10 +494,6 @@ def _apply_shapes(base: Image.Image, size: tuple[int, int], shapes: list[dict])
             continue
         if w <= 0 or h <= 0:
             continue
-        x1 = int(x * tw)
-        y1 = int(y * th)
-        x2 = int((x + w) * tw)
-        y2 = int((y + h) * th)
         color_hex = shape.get("color") or "#ffffff"
         try:
             rgb = _hex_to_rgb(color_hex)
@@ -475,31 +503,54 @@ def _apply_shapes(base: Image.Image, size: tuple[int, int], shapes: list[dict])
             alpha = max(0.0, min(1.0, float(shape.get("opacity", 1))))
         except (TypeError, ValueError):
             alpha = 1.0
-        fill = rgb + (int(alpha * 255),)
-        shape_type = (shape.get("shape") or "rect").lower()
-
-        if shape_type == "square":
-            side = min(x2 - x1, y2 - y1)
-            x2 = x1 + side
-            y2 = y1 + side
-            draw.rectangle((x1, y1, x2, y2), fill=fill)
-        elif shape_type == "circle":
-            draw.ellipse((x1, y1, x2, y2), fill=fill)
-        elif shape_type == "triangle":
-            draw.polygon([(x1, y2), ((x1 + x2) // 2, y1), (x2, y2)], fill=fill)
-        elif shape_type == "star":
-            cx = (x1 + x2) / 2
-            cy = (y1 + y2) / 2
-            outer = min(x2 - x1, y2 - y1) / 2
-            inner = outer * 0.5
-            points = []
-            for i in range(10):
-                ang = math.radians(i * 36 - 90)
-                r = outer if i % 2 == 0 else inner
-                points.append((cx + r * math.cos(ang), cy + r * math.sin(ang)))
-            draw.polygon(points, fill=fill)
-        else:
-            draw.rectangle((x1, y1, x2, y2), fill=fill)
+        ops.append(
+            ShapeOp(
+                shape=(shape.get("shape") or "rect").lower(),
+                box=(x, y, w, h),
+                fill=rgb + (int(alpha * 255),),
+            )
+        )
+    return tuple(ops)
+
+
+def _draw_shapes(base: Image.Image, size: tuple[int, int], shapes: tuple[ShapeOp, ...]) -> None:
+    tw, th = size
+    draw = ImageDraw.Draw(base, "RGBA")
+    for op in shapes:
+        x, y, w, h = op.box
+        px_box = (int(x * tw), int(y * th), int((x + w) * tw), int((y + h) * th))
+        _draw_shape(draw, op.shape, px_box, op.fill)
+
+
+def _draw_shape(
+    draw: ImageDraw.ImageDraw,
+    shape_type: str,
+    box: tuple[int, int, int, int],
+    fill: tuple[int, int, int, int],
+) -> None:
+    x1, y1, x2, y2 = box
+    if shape_type == "square":
+        side = min(x2 - x1, y2 - y1)
+        x2 = x1 + side
+        y2 = y1 + side
+        draw.rectangle((x1, y1, x2, y2), fill=fill)
+    elif shape_type == "circle":
+        draw.ellipse((x1, y1, x2, y2), fill=fill)
+    elif shape_type == "triangle":
+        draw.polygon([(x1, y2), ((x1 + x2) // 2, y1), (x2, y2)], fill=fill)
+    elif shape_type == "star":
+        cx = (x1 + x2) / 2
+        cy = (y1 + y2) / 2
+        outer = min(x2 - x1, y2 - y1) / 2
+        inner = outer * 0.5
+        points = []
+        for i in range(10):
+            ang = math.radians(i * 36 - 90)
+            r = outer if i % 2 == 0 else inner
+            points.append((cx + r * math.cos(ang), cy + r * math.sin(ang)))
+        draw.polygon(points, fill=fill)
+    else:
+        draw.rectangle((x1, y1, x2, y2), fill=fill)
 
 
 def _norm_box_to_px(
@@ -528,76 +579,126 @@ def _draw_box_scrim(draw: ImageDraw.ImageDraw, box: tuple[int, int, int, int], a
 def _apply_bottom_gradient_scrim(img_rgba: Image.Image, y0: int, max_alpha: int) -> Image.Image:
     """
     Apply a transparent->black gradient starting at y0 to the bottom.
+    Composites in place over the affected band only and returns img_rgba.
     """
     w, h = img_rgba.size
-    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
-
-    height = max(1, h - max(0, y0))
-    for i in range(height):
-        a = int((i / height) * max_alpha)
-        y = max(0, y0) + i
-        draw.line([(0, y), (w, y)], fill=(0, 0, 0, a))
-
-    return Image.alpha_composite(img_rgba, overlay)
+    top = max(0, y0)
+    if top >= h:
+        return img_rgba
+    img_rgba.alpha_composite(_scrim_band(w, h - top, max_alpha), dest=(0, top))
+    return img_rgba
+
+
+@lru_cache(maxsize=32)
+def _scrim_band(w: int, height: int, max_alpha: int) -> Image.Image:
+    # Shared between renders; callers only read it. Same ramp as int(i / height * max_alpha).
+    ramp = (np.arange(height, dtype=np.float64) / height * max_alpha).astype(np.uint8)
+    alpha = np.broadcast_to(ramp[:, None], (height, w))
+    band = Image.new("RGBA", (w, height), (0, 0, 0, 0))
+    band.putalpha(Image.fromarray(np.ascontiguousarray(alpha), mode="L"))
+    return band
+
+
+# Parsed FreeType faces are reused across calls; text fitting asks for many sizes per block.
+_FONT_CACHE_SIZE = 256
+
+_FONT_FAMILY_CANDIDATES: dict[str, tuple[str, ...]] = {
+    "dejavu": (
+        "assets/fonts/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ),
+    "helvetica": (
+        "/System/Library/Fonts/Supplemental/Helvetica.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+    ),
+    "inter": ("assets/fonts/Inter-Regular.ttf",),
+    "": (
+        "assets/fonts/DejaVuSans.ttf",
+        "assets/fonts/Inter-Regular.ttf",
+        "/System/Library/Fonts/Supplemental/Arial.ttf",
+        "/System/Library/Fonts/Supplemental/Helvetica.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "/Library/Fonts/Arial.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "C:\\\\Windows\\\\Fonts\\\\arial.ttf",
+    ),
+}
+_FONT_FAMILY_ALIASES = {
+    "dejavu sans": "dejavu",
+    "dejavu_sans": "dejavu",
+    "helvetica neue": "helvetica",
+    "inter regular": "inter",
+}
+_FONT_FALLBACK_CANDIDATES = (
+    "/System/Library/Fonts/Supplemental/Helvetica.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+    "/Library/Fonts/Arial.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "C:\\\\Windows\\\\Fonts\\\\arial.ttf",
+)
 
 
 def _load_font(size: int, font_family: str | None = None) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     """
     Prefer a TTF font (system or bundled). If we can't find one, fall back to the
     default bitmap font (which is small and not ideal, but avoids crashing).
+
+    Family -> file resolution happens once per family; font objects are cached per (file, size).
     """
-    # Allow overriding via env later; for now probe common locations.
-    family = (font_family or "").strip().lower()
-    if family in ("dejavu", "dejavu sans", "dejavu_sans"):
-        candidates = [
-            "assets/fonts/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        ]
-    elif family in ("helvetica", "helvetica neue"):
-        candidates = [
-            "/System/Library/Fonts/Supplemental/Helvetica.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-        ]
-    elif family in ("inter", "inter regular"):
-        candidates = [
-            "assets/fonts/Inter-Regular.ttf",
-        ]
-    else:
-        candidates = [
-            "assets/fonts/DejaVuSans.ttf",
-            "assets/fonts/Inter-Regular.ttf",
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/System/Library/Fonts/Supplemental/Helvetica.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/Library/Fonts/Arial.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "C:\\\\Windows\\\\Fonts\\\\arial.ttf",
-        ]
+    path = _resolve_font_file((font_family or "").strip().lower())
+    if path is None:
+        return _default_font()
     try:
-        from pathlib import Path
-
-        for c in candidates:
-            p = Path(c)
-            if p.exists():
-                return ImageFont.truetype(str(p), size=size)
-        fallback = [
-            "/System/Library/Fonts/Supplemental/Helvetica.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/System/Library/Fonts/Supplemental/Arial.ttf",
-            "/Library/Fonts/Arial.ttf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "C:\\\\Windows\\\\Fonts\\\\arial.ttf",
-        ]
-        for c in fallback:
-            p = Path(c)
-            if p.exists():
-                return ImageFont.truetype(str(p), size=size)
+        return _truetype_font(path, int(size))
     except Exception:
-        pass
+        return _default_font()
+
+
+@lru_cache(maxsize=None)
+def _resolve_font_file(family: str) -> str | None:
+    family = _FONT_FAMILY_ALIASES.get(family, family)
+    # Unknown families behave like "no preference".
+    candidates = _FONT_FAMILY_CANDIDATES.get(family, _FONT_FAMILY_CANDIDATES[""])
+    for c in (*candidates, *_FONT_FALLBACK_CANDIDATES):
+        try:
+            if Path(c).exists():
+                return c
+        except OSError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=_FONT_CACHE_SIZE)
+def _truetype_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(path, size=size)
+
+
+@lru_cache(maxsize=1)
+def _default_font() -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
+def font_cache_info() -> dict:
+    """Hit/miss counters of the font registry and word-advance cache (exposed via /debug/cache_stats)."""
+    fonts = _truetype_font.cache_info()
+    files = _resolve_font_file.cache_info()
+    advances = _text_advance.cache_info()
+    return {
+        "hits": fonts.hits,
+        "misses": fonts.misses,
+        "size": fonts.currsize,
+        "max_size": fonts.maxsize,
+        "resolved_families": files.currsize,
+        "advances": {
+            "hits": advances.hits,
+            "misses": advances.misses,
+            "size": advances.currsize,
+            "max_size": advances.maxsize,
+        },
+    }
+
+
 def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     s = hex_color.strip().lstrip("#")
     if len(s) == 3:
@@ -654,7 +755,7 @@ def _apply_motif_overlay(
     mp = (motif_position or "right").strip().lower()
     if mp in ("full", "cover"):
         # Full-canvas motif (rarely desired once you start doing cover-crop masters).
-        motif_rgba = _resize_cover(motif.convert("RGBA"), (w, h))
+        motif_rgba = _resize_cover(motif, (w, h), mode="RGBA")
         x0, y0 = 0, 0
     else:
         # Place motif as a design element on one side, preserving its proportions.
@@ -672,7 +773,7 @@ def _apply_motif_overlay(
 
         bw = max(1, box[2] - box[0])
         bh = max(1, box[3] - box[1])
-        motif_rgba = _contain(motif.convert("RGBA"), (bw, bh))
+        motif_rgba = _contain(motif, (bw, bh), mode="RGBA")
 
         # Right-align within the box by default (matches common "logo outline" usage).
         x0 = box[2] - motif_rgba.size[0]
@@ -702,17 +803,17 @@ def _apply_motif_overlay(
     return Image.alpha_composite(base_rgba, overlay)
 
 
-def _contain(img: Image.Image, size: tuple[int, int]) -> Image.Image:
+def _contain(img: Image.Image, size: tuple[int, int], mode: str | None = None) -> Image.Image:
     """
     Resize to fit within size (no crop), preserving aspect ratio.
     """
     tw, th = size
     iw, ih = img.size
     if iw <= 0 or ih <= 0:
-        return img.resize(size, Image.Resampling.LANCZOS)
+        return _resample(img, size, mode)
     scale = min(tw / iw, th / ih)
     nw, nh = max(1, int(iw * scale)), max(1, int(ih * scale))
-    return img.resize((nw, nh), Image.Resampling.LANCZOS)
+    return _resample(img, (nw, nh), mode)
 
 
 def _tint_preserving_alpha(img_rgba: Image.Image, tint_hex: str) -> Image.Image:
@@ -758,57 +859,107 @@ def _fit_text_to_box(
     min_font_px: int,
     font_family: str | None = None,
 ) -> tuple[ImageFont.ImageFont, str, int]:
+    """
+    Largest font size (stepping down from max_font_px by 2) whose wrapped text fits in box.
+
+    Fit is not monotonic in size (re-wrapping moves words between lines, which changes ink
+    extents), so sizes are still tried from the top down and the answer is the linear scan's.
+    What is skipped is the expensive part: a size whose wrapped line count alone rules out the
+    box height never gets a full multiline bbox measurement.
+    """
     x1, y1, x2, y2 = box
     max_w = max(1, x2 - x1)
     max_h = max(1, y2 - y1)
 
-    max_font_px = max(min_font_px, max_font_px)
-
-    for px in range(max_font_px, min_font_px - 1, -2):
+    for px in range(max(min_font_px, max_font_px), min_font_px - 1, -2):
         font = _load_font(px, font_family=font_family)
         spacing = max(2, int(px * 0.18))
         wrapped = _wrap_to_width(draw, text, font, max_w)
+        if _min_text_height(font, wrapped.count("\n") + 1, spacing) > max_h:
+            continue
         try:
             bbox = draw.multiline_textbbox((0, 0), wrapped, font=font, spacing=spacing)
-            w = bbox[2] - bbox[0]
-            h = bbox[3] - bbox[1]
-            if w <= max_w and h <= max_h:
-                return font, wrapped, spacing
         except Exception:
             # Fallback: accept this size if no bbox measurement available.
             return font, wrapped, spacing
+        if (bbox[2] - bbox[0]) <= max_w and (bbox[3] - bbox[1]) <= max_h:
+            return font, wrapped, spacing
 
     font = _load_font(min_font_px, font_family=font_family)
     spacing = max(2, int(min_font_px * 0.18))
     return font, _wrap_to_width(draw, text, font, max_w), spacing
 
 
+def _min_text_height(font, lines: int, spacing: int) -> float:
+    """
+    Lower bound on the ink height of `lines` lines drawn by multiline_text: line i starts at
+    i * (bbox("A") bottom + spacing) and every line's ink lies within ascent + descent.
+    """
+    if lines <= 1:
+        return 0
+    try:
+        pitch = font.getbbox("A")[3] + spacing
+        ascent, descent = font.getmetrics()
+    except Exception:
+        return 0
+    return (lines - 1) * pitch - (ascent + descent)
+
+
+# Word advances are reused across candidate sizes, ratios and re-renders of the same copy.
+_TEXT_ADVANCE_CACHE_SIZE = 8192
+
+
 def _wrap_to_width(draw: ImageDraw.ImageDraw, text: str, font, max_w: int) -> str:
+    """
+    Greedy word wrap. Line widths are composed from cached per-(font, word) advances and the
+    font's space advance, so no string is re-measured while a line grows.
+    """
     words = [w for w in (text or "").split() if w]
     if not words:
         return ""
+    try:
+        space_w = _text_advance(font, " ")
+        word_ws = [_text_advance(font, w) for w in words]
+    except Exception:
+        return _wrap_by_chars(words, max_w)
+    lines: list[str] = []
+    cur = [words[0]]
+    cur_w = word_ws[0]
+    for w, ww in zip(words[1:], word_ws[1:]):
+        trial_w = cur_w + space_w + ww
+        if trial_w <= max_w:
+            cur.append(w)
+            cur_w = trial_w
+        else:
+            lines.append(" ".join(cur))
+            cur = [w]
+            cur_w = ww
+    lines.append(" ".join(cur))
+    return "\n".join(lines)
+
+
+def _wrap_by_chars(words: list[str], max_w: int) -> str:
+    # If measurement fails, fallback to a crude char-based wrap.
+    limit = max(10, int(max_w / 12))
     lines: list[str] = []
     cur = words[0]
     for w in words[1:]:
         trial = f"{cur} {w}"
-        try:
-            bbox = draw.textbbox((0, 0), trial, font=font)
-            if (bbox[2] - bbox[0]) <= max_w:
-                cur = trial
-            else:
-                lines.append(cur)
-                cur = w
-        except Exception:
-            # If measurement fails, fallback to a crude char-based wrap.
-            if len(trial) <= max(10, int(max_w / 12)):
-                cur = trial
-            else:
-                lines.append(cur)
-                cur = w
+        if len(trial) <= limit:
+            cur = trial
+        else:
+            lines.append(cur)
+            cur = w
     lines.append(cur)
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=_TEXT_ADVANCE_CACHE_SIZE)
+def _text_advance(font, text: str) -> float:
+    # Fonts come from the _load_font registry, so (font object, text) is a stable key.
+    return font.getlength(text)
+
+
 def _draw_cta_button(
     draw: ImageDraw.ImageDraw,
     cta: str,
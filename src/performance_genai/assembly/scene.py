@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from PIL import Image, ImageDraw
+
+from performance_genai.assembly.render import (
+    RenderedMaster,
+    ShapeOp,
+    _apply_elements,
+    _compile_shapes,
+    _draw_shapes,
+    _hex_to_rgb,
+    _load_font,
+    _norm_box_to_px,
+    _parse_image_box,
+    _place_kv,
+    _wrap_to_width,
+)
+
+
+@dataclass(frozen=True)
+class FontSize:
+    """
+    How a layer's font size follows the canvas:
+      - scaled: editor px at a reference width (font_px / font_base_width)
+      - box:    fraction of the layer box height (font_size_box_norm)
+      - width:  fraction of the canvas width (font_size_norm)
+      - half:   half the box height (no usable size given)
+    """
+
+    kind: str
+    value: float = 0.0
+    base: float = 1.0
+
+    def px(self, canvas_w: int, box_h: int) -> int:
+        if self.kind == "scaled":
+            return max(10, int(self.value * (canvas_w / self.base)))
+        if self.kind == "box":
+            return max(10, int(self.value * box_h))
+        if self.kind == "width":
+            return max(10, int(self.value * canvas_w))
+        return max(12, int(box_h * 0.5))
+
+
+@dataclass(frozen=True)
+class TextBackground:
+    fill: tuple[int, int, int, int]
+    # (px, base width) pairs scaled with the canvas; None falls back to the defaults.
+    radius: tuple[float, float] | None = None
+    padding: tuple[float, float] | None = None
+
+
+@dataclass(frozen=True)
+class TextOp:
+    text: str
+    wrapped: str | None  # editor-provided line breaks; otherwise wrapped per size
+    box: tuple[float, float, float, float]
+    font_size: FontSize
+    font_family: str
+    color: tuple[int, int, int, int]
+    align: str
+    background: TextBackground | None = None
+
+
+@dataclass(frozen=True)
+class Scene:
+    """
+    A text-layers layout validated once into draw operations. Everything is normalized,
+    so the same scene replays at any master or export size.
+    """
+
+    layout_hash: str
+    image_box: tuple[float, float, float, float] | None
+    shapes: tuple[ShapeOp, ...]
+    text: tuple[TextOp, ...]
+
+
+_SCENE_CACHE_SIZE = 256
+_scenes: OrderedDict[str, Scene] = OrderedDict()
+_scene_lock = threading.Lock()
+_scene_stats = {"hits": 0, "misses": 0}
+
+
+def compile_layout(
+    text_layers: list[dict] | None,
+    font_family: str,
+    text_color_hex: str,
+    text_align: str = "left",
+    image_box: dict | None = None,
+    shapes: list[dict] | None = None,
+) -> Scene:
+    """Compile (or fetch by layout hash) the scene for a text-layers layout."""
+    payload = {
+        "text_layers": text_layers or [],
+        "font_family": font_family,
+        "text_color": text_color_hex,
+        "text_align": text_align,
+        "image_box": image_box,
+        "shapes": shapes or [],
+    }
+    layout_hash = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    ).hexdigest()
+    with _scene_lock:
+        scene = _scenes.get(layout_hash)
+        if scene is not None:
+            _scenes.move_to_end(layout_hash)
+            _scene_stats["hits"] += 1
+            return scene
+        _scene_stats["misses"] += 1
+    scene = Scene(
+        layout_hash=layout_hash,
+        image_box=_parse_image_box(image_box),
+        shapes=_compile_shapes(shapes or []),
+        text=_compile_text_layers(text_layers or [], font_family, text_color_hex, text_align),
+    )
+    with _scene_lock:
+        _scenes[layout_hash] = scene
+        while len(_scenes) > _SCENE_CACHE_SIZE:
+            _scenes.popitem(last=False)
+    return scene
+
+
+def scene_cache_info() -> dict[str, int]:
+    with _scene_lock:
+        return {**_scene_stats, "size": len(_scenes), "max_size": _SCENE_CACHE_SIZE}
+
+
+def render_scene(
+    scene: Scene,
+    kv: Image.Image,
+    size: tuple[int, int],
+    elements: list[dict] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> RenderedMaster:
+    base = _place_kv(kv, size, scene.image_box, resample=resample)
+    if scene.shapes:
+        _draw_shapes(base, size, scene.shapes)
+    if elements:
+        _apply_elements(base, size, elements, resample=resample)
+    draw = ImageDraw.Draw(base)
+    for op in scene.text:
+        _draw_text_op(draw, op, size)
+    return RenderedMaster(image=base.convert("RGB"), scrim_applied=False)
+
+
+def render_text_layers(
+    kv: Image.Image,
+    size: tuple[int, int],
+    text_layers: list[dict],
+    font_family: str,
+    text_color_hex: str,
+    text_align: str = "left",
+    image_box: dict | None = None,
+    elements: list[dict] | None = None,
+    shapes: list[dict] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+) -> RenderedMaster:
+    """
+    Render multiple text boxes using absolute font sizes from the editor.
+    Each layer expects:
+      - text: string
+      - box: {x,y,w,h} normalized to 0..1
+      - font_size_norm: font px / canvas height
+      - font_family, color, align (optional overrides)
+    The layout is compiled once per distinct payload, so ratio variants and exports of
+    the same layout only pay for drawing. `resample` filters the KV and elements.
+    """
+    scene = compile_layout(text_layers, font_family, text_color_hex, text_align, image_box=image_box, shapes=shapes)
+    return render_scene(scene, kv, size, elements=elements, resample=resample)
+
+
+def _compile_text_layers(
+    text_layers: list[Any],
+    font_family: str,
+    text_color_hex: str,
+    text_align: str,
+) -> tuple[TextOp, ...]:
+    default_align = (text_align or "left").strip().lower()
+    default_color = _hex_to_rgb(text_color_hex) + (255,)
+    ops: list[TextOp] = []
+    for layer in text_layers:
+        if not isinstance(layer, dict):
+            continue
+        text = (layer.get("text_wrapped") or layer.get("text") or "").strip()
+        if not text:
+            continue
+        box = layer.get("box") or {}
+        try:
+            box_norm = (
+                float(box.get("x", 0)),
+                float(box.get("y", 0)),
+                float(box.get("w", 0)),
+                float(box.get("h", 0)),
+            )
+        except (TypeError, ValueError):
+            continue
+        # Zero-area boxes never draw at any size.
+        if box_norm[2] <= 0 or box_norm[3] <= 0:
+            continue
+
+        text_wrapped = layer.get("text_wrapped")
+        color_hex = layer.get("color") or text_color_hex
+        try:
+            color = _hex_to_rgb(color_hex) + (255,)
+        except Exception:
+            color = default_color
+        ops.append(
+            TextOp(
+                text=text,
+                wrapped=text_wrapped if isinstance(text_wrapped, str) and text_wrapped.strip() else None,
+                box=box_norm,
+                font_size=_compile_font_size(layer),
+                font_family=layer.get("font_family") or font_family,
+                color=color,
+                align=(layer.get("align") or default_align).strip().lower(),
+                background=_compile_background(layer),
+            )
+        )
+    return tuple(ops)
+
+
+def _compile_font_size(layer: dict) -> FontSize:
+    # Precedence matches the editor: scaled px, then box-relative, then width-relative.
+    if layer.get("font_px") is not None and layer.get("font_base_width"):
+        scaled = _scaled_pair(layer.get("font_px"), layer.get("font_base_width"))
+        if scaled is not None:
+            return FontSize("scaled", *scaled)
+    font_size_box_norm = layer.get("font_size_box_norm")
+    if font_size_box_norm is not None:
+        try:
+            return FontSize("box", float(font_size_box_norm))
+        except (TypeError, ValueError):
+            return FontSize("half")
+    font_size_norm = layer.get("font_size_norm")
+    if font_size_norm is None:
+        return FontSize("half")
+    try:
+        return FontSize("width", float(font_size_norm))
+    except (TypeError, ValueError):
+        return FontSize("half")
+
+
+def _compile_background(layer: dict) -> TextBackground | None:
+    bg_color = layer.get("bg_color")
+    bg_opacity = layer.get("bg_opacity")
+    if not bg_color or bg_opacity is None:
+        return None
+    try:
+        alpha = max(0, min(1, float(bg_opacity)))
+    except (TypeError, ValueError):
+        alpha = 0
+    if alpha <= 0:
+        return None
+    try:
+        bg_rgb = _hex_to_rgb(bg_color)
+    except Exception:
+        bg_rgb = (0, 0, 0)
+    radius = None
+    if layer.get("bg_radius_px") is not None and layer.get("bg_radius_base_width"):
+        radius = _scaled_pair(layer.get("bg_radius_px"), layer.get("bg_radius_base_width"))
+    padding = None
+    if layer.get("bg_padding_px") is not None and layer.get("bg_padding_base_width"):
+        padding = _scaled_pair(layer.get("bg_padding_px"), layer.get("bg_padding_base_width"))
+    return TextBackground(fill=bg_rgb + (int(alpha * 255),), radius=radius, padding=padding)
+
+
+def _scaled_pair(px: Any, base_width: Any) -> tuple[float, float] | None:
+    try:
+        value, base = float(px), float(base_width)
+    except (TypeError, ValueError):
+        return None
+    if base == 0:
+        return None
+    return (value, base)
+
+
+def _draw_text_op(draw: ImageDraw.ImageDraw, op: TextOp, size: tuple[int, int]) -> None:
+    px_box = _norm_box_to_px(op.box, size)
+    if px_box is None:
+        return
+    x1, y1, x2, y2 = px_box
+    max_w = max(1, x2 - x1)
+
+    font_px = op.font_size.px(size[0], y2 - y1)
+    font = _load_font(font_px, font_family=op.font_family)
+    spacing = max(2, int(font_px * 0.18))
+    wrapped = op.wrapped if op.wrapped is not None else _wrap_to_width(draw, op.text, font, max_w)
+
+    bg = op.background
+    if bg is not None:
+        radius_px = bg.radius[0] * (size[0] / bg.radius[1]) if bg.radius else 0
+        pad_px = bg.padding[0] * (size[0] / bg.padding[1]) if bg.padding else 0
+        if pad_px <= 0:
+            pad_px = max(4, min(24, font_px * 0.22))
+        x1p = max(0, int(x1 - pad_px))
+        y1p = max(0, int(y1 - pad_px))
+        x2p = min(size[0], int(x2 + pad_px))
+        y2p = min(size[1], int(y2 + pad_px))
+        radius_px = max(0, min(radius_px, min(x2p - x1p, y2p - y1p) / 2))
+        try:
+            draw.rounded_rectangle((x1p, y1p, x2p, y2p), radius=radius_px, fill=bg.fill)
+        except Exception:
+            draw.rectangle((x1p, y1p, x2p, y2p), fill=bg.fill)
+
+    tx = x1
+    if op.align in ("center", "right"):
+        try:
+            bbox = draw.multiline_textbbox((0, 0), wrapped, font=font, spacing=spacing)
+            tw = bbox[2] - bbox[0]
+        except Exception:
+            tw = 0
+        if op.align == "center":
+            tx = x1 + max(0, (max_w - tw) // 2)
+        else:
+            tx = x2 - tw
+
+    draw.multiline_text((tx, y1), wrapped, font=font, fill=op.color, spacing=spacing)
@@ -18,7 +18,20 @@ class Settings(BaseSettings):
     gemini_image_model: str = "imagen-3.0-generate-002"
     openai_text_model: str = "gpt-4.1-mini"
 
+    # Storage
+    project_cache_size: int = 128  # parsed projects kept in memory by ProjectStore.read_project
+    derivative_cache_max_bytes: int = 512 * 1024 * 1024  # on-disk thumbnails under data_dir/derivatives
+    render_cache_max_bytes: int = 1024 * 1024 * 1024  # encoded layout exports under data_dir/renders
+
+    # Concurrency
+    blocking_workers: int = 8  # threads for render/encode/storage work started from async handlers
+    loop_stall_warn_ms: int = 250  # log event-loop stalls at least this long; 0 disables the monitor
+
     # Rendering
+    decoded_image_cache_max_bytes: int = 512 * 1024 * 1024  # decoded KV/element pixels, split across render processes
+    pyramid_cache_max_bytes: int = 256 * 1024 * 1024  # downscaled copies used for resampling, split the same way
+    render_workers: int | None = None  # processes rendering ratio variants; None = min(4, CPUs), 0 = in-process
+    draft_preview_scale: float = 0.5  # editor draft previews render at this fraction of the master size
     master_sizes: dict[str, tuple[int, int]] = {
         "1:1": (1080, 1080),
         "4:5": (1080, 1350),
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from pathlib import Path
+
+
+class DiskCache:
+    """
+    Size-bounded directory of immutable files addressed by string keys.
+
+    Hits refresh the file's mtime; once the total size exceeds max_bytes the least
+    recently used entries are evicted down to a low watermark so eviction scans stay rare.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, low_watermark: float = 0.9) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self.low_watermark = low_watermark
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    def path_for(self, key: str) -> Path:
+        # Keys are hash-prefixed, so fan out on the first two characters like blob storage.
+        name = os.path.basename(key)
+        return self.root / name[:2] / name
+
+    def get(self, key: str) -> Path | None:
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            previous = path.stat().st_size
+        except FileNotFoundError:
+            previous = 0
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._total_bytes += len(data) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict(keep=path)
+        return path
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        out: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*"):
+            if path.name.endswith(".tmp"):
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            out.append((st.st_mtime, st.st_size, path))
+        return out
+
+    def _evict(self, keep: Path) -> None:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * self.low_watermark)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+        self._total_bytes = total
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from performance_genai.config import settings
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Blocking work started from async handlers (Pillow renders/encodes, hashing, file and SQLite
+# writes) runs here instead of on the event loop. Pillow and hashlib release the GIL for the
+# heavy parts, so these threads overlap for real.
+blocking_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.blocking_workers),
+    thread_name_prefix="blocking",
+)
+
+
+async def run_blocking(fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(blocking_executor, functools.partial(fn, *args, **kwargs))
+
+
+class LoopStallMonitor:
+    """
+    Logs a warning whenever the event loop wakes up more than threshold_s later than asked,
+    i.e. something ran on the loop for that long without yielding.
+    """
+
+    def __init__(self, threshold_s: float, interval_s: float = 0.1) -> None:
+        self.threshold_s = threshold_s
+        self.interval_s = interval_s
+        self.stalls = 0
+        self.max_stall_s = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self.threshold_s > 0 and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "threshold_ms": round(self.threshold_s * 1000),
+            "stalls": self.stalls,
+            "max_stall_ms": round(self.max_stall_s * 1000, 1),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval_s)
+            lag = time.perf_counter() - started - self.interval_s
+            if lag >= self.threshold_s:
+                self.stalls += 1
+                self.max_stall_s = max(self.max_stall_s, lag)
+                logger.warning("event loop stalled for %.0f ms", lag * 1000)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+
+class DecodedImageCache:
+    """
+    Memory-bounded LRU of decoded images keyed by (content sha256, mode).
+
+    Cached images are shared between requests and threads: callers must treat them as
+    read-only (every renderer resizes/converts into a new image before drawing).
+    mode=None keeps the file's own mode, like a bare Image.open().
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str | None], Image.Image] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def open(self, sha256: str, path: Path, mode: str | None = None) -> Image.Image:
+        key = (sha256, mode)
+        with self._lock:
+            img = self._entries.get(key)
+            if img is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return img
+            self.misses += 1
+
+        # Decode outside the lock; a concurrent miss on the same key just decodes twice.
+        with Image.open(path) as src:
+            img = src.convert(mode) if mode else src.copy()
+        size = _image_bytes(img)
+        if size > self.max_bytes:
+            return img
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = img
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= _image_bytes(evicted)
+                self.evictions += 1
+        return img
+
+    def info(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def _image_bytes(img: Image.Image) -> int:
+    return img.width * img.height * len(img.getbands())
@@ -7,6 +7,7 @@ from typing import Any
 
 from PIL import Image
 
+from performance_genai.assembly.canvas import noise_canvas
 from performance_genai.config import settings
 from performance_genai.providers.base import GeneratedImage, ObservedProfileResult
 
@@ -194,12 +195,13 @@ class GeminiProvider:
     async def reframe_kv_with_motif(
         self,
         kv_image: Path,
-        motif_image: Path | None,
+        motif_image: Path | Image.Image | None,
         prompt: str,
         aspect_ratio: str,
         image_size: str = "2K",
         n: int = 1,
         locked_canvas: Image.Image | None = None,
+        canvas_seed: int | None = None,
     ) -> list[GeneratedImage]:
         """
         Generate a text-free "master visual" variant by asking the image model to:
@@ -225,17 +227,21 @@ class GeminiProvider:
             f"\n{prompt}\n"
         )
 
+        # Provide a "locked canvas" input (base image centered or positioned on a larger canvas)
+        # so the model is biased toward only filling the empty margins. Built once and reused
+        # for every attempt.
+        locked = locked_canvas
+        if locked is None:
+            base_img = Image.open(kv_image).convert("RGB")
+            locked = _make_outpaint_canvas(base_img, aspect_ratio=aspect_ratio, seed=canvas_seed)
+        # Async callers pass the motif already decoded, like locked_canvas.
+        motif = Image.open(motif_image) if isinstance(motif_image, Path) else motif_image
+
         out: list[GeneratedImage] = []
         for _ in range(max(1, n)):
-            contents: list[Any] = [enriched]
-
-            # Provide a "locked canvas" input (base image centered or positioned on a larger canvas)
-            # so the model is biased toward only filling the empty margins.
-            base_img = Image.open(kv_image).convert("RGB")
-            locked = locked_canvas or _make_outpaint_canvas(base_img, aspect_ratio=aspect_ratio)
-            contents.append(locked)
-            if motif_image is not None:
-                contents.append(Image.open(motif_image))
+            contents: list[Any] = [enriched, locked]
+            if motif is not None:
+                contents.append(motif)
 
             resp = self.client.models.generate_content(
                 model=model,
@@ -276,7 +282,7 @@ def _parse_ratio(aspect_ratio: str) -> tuple[int, int] | None:
         return None
 
 
-def _make_outpaint_canvas(base: Image.Image, aspect_ratio: str) -> Image.Image:
+def _make_outpaint_canvas(base: Image.Image, aspect_ratio: str, seed: int | None = None) -> Image.Image:
     """
     Create a larger canvas at the requested aspect ratio, without cropping the base:
     - if target is wider, expand width and center base
@@ -307,19 +313,7 @@ def _make_outpaint_canvas(base: Image.Image, aspect_ratio: str) -> Image.Image:
     th = max(th, oh)
 
     # Mid-gray background with tiny noise so the model doesn't treat it as "intentional black bars".
-    canvas = Image.new("RGB", (tw, th), (128, 128, 128))
-    # Very light noise pattern.
-    try:
-        import random
-
-        px = canvas.load()
-        for _ in range(int(tw * th * 0.002)):
-            x = random.randint(0, tw - 1)
-            y = random.randint(0, th - 1)
-            v = 120 + random.randint(0, 20)
-            px[x, y] = (v, v, v)
-    except Exception:
-        pass
+    canvas = noise_canvas((tw, th), seed=seed)
 
     x0 = (tw - ow) // 2
     y0 = (th - oh) // 2
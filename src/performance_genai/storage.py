@@ -1,28 +1,37 @@
 from __future__ import annotations
 
+import argparse
 import hashlib
 import json
 import os
 import shutil
+import sqlite3
+import threading
 import uuid
-from dataclasses import asdict, dataclass
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager, closing, contextmanager
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Iterator
+
+import aiofiles
 
 from performance_genai.config import settings
+from performance_genai.execution import run_blocking
 
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+# Read/write granularity when streaming asset content into blob storage.
+_BLOB_CHUNK_BYTES = 1024 * 1024
+
+
+def _blob_rel_path(sha256: str) -> str:
+    # Content-addressed: identical bytes map to one file, fanned out by hash prefix.
+    return str(Path("blobs") / sha256[:2] / sha256)
 
 
 def _safe_filename(name: str) -> str:
@@ -50,6 +59,165 @@ class Project:
     created_at: str
     assets: list[Asset]
     observed_profile: dict[str, Any] | None
+    # Lookup indexes over `assets`, rebuilt by the store via index_assets(); never persisted.
+    assets_by_id: dict[str, Asset] = field(default_factory=dict, init=False, repr=False, compare=False)
+    assets_by_kind: dict[str, list[Asset]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _positions: dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _blob_refs: Counter[str] = field(default_factory=Counter, init=False, repr=False, compare=False)
+
+    def index_assets(self) -> None:
+        by_id: dict[str, Asset] = {}
+        by_kind: dict[str, list[Asset]] = {}
+        positions: dict[str, int] = {}
+        blob_refs: Counter[str] = Counter()
+        for pos, a in enumerate(self.assets):
+            by_id[a.asset_id] = a
+            by_kind.setdefault(a.kind, []).append(a)
+            positions[a.asset_id] = pos
+            blob_refs[a.rel_path] += 1
+        self.assets_by_id = by_id
+        self.assets_by_kind = by_kind
+        self._positions = positions
+        self._blob_refs = blob_refs
+
+    def blob_refcount(self, rel_path: str) -> int:
+        """
+        Number of assets pointing at the file at `rel_path` (content-addressed blobs are shared).
+        """
+        return self._blob_refs.get(rel_path, 0)
+
+    def get_asset(self, asset_id: str, *kinds: str) -> Asset | None:
+        """
+        Constant-time lookup by id, optionally restricted to one of `kinds`.
+        """
+        asset = self.assets_by_id.get(asset_id)
+        if asset is None or (kinds and asset.kind not in kinds):
+            return None
+        return asset
+
+    def assets_of_kind(self, *kinds: str) -> list[Asset]:
+        """
+        Assets of the given kinds in their stored (oldest-first) order.
+        """
+        if len(kinds) == 1:
+            return list(self.assets_by_kind.get(kinds[0], []))
+        out: list[Asset] = []
+        for kind in kinds:
+            out.extend(self.assets_by_kind.get(kind, []))
+        out.sort(key=lambda a: self._positions[a.asset_id])
+        return out
+
+
+@dataclass(frozen=True)
+class ProjectSummary:
+    # Catalog row used for listings; avoids parsing every project.json.
+    project_id: str
+    name: str
+    brand_name: str | None
+    campaign_name: str | None
+    created_at: str
+    asset_count: int
+    asset_counts: dict[str, int]
+
+
+_CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    project_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    brand_name TEXT,
+    campaign_name TEXT,
+    created_at TEXT NOT NULL,
+    asset_count INTEGER NOT NULL DEFAULT 0,
+    asset_counts TEXT NOT NULL DEFAULT '{}'
+)
+"""
+
+
+_CATALOG_UPSERT = (
+    "INSERT OR REPLACE INTO projects "
+    "(project_id, name, brand_name, campaign_name, created_at, asset_count, asset_counts) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+# Mutations are appended to this JSONL journal and folded into project.json on compaction.
+_JOURNAL_NAME = "assets.jsonl"
+# Compact once the journal outgrows the snapshot so rewrites stay amortized O(1) per append,
+# but leave small projects alone.
+_JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+
+
+def _replay_journal(assets: list[Asset], journal_path: Path) -> list[Asset]:
+    if not journal_path.exists():
+        return assets
+    by_id = {a.asset_id: a for a in assets}
+    with journal_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn trailing write from a crash; everything before it is still valid.
+                continue
+            op = record.get("op")
+            if op == "add":
+                asset = Asset(**record["asset"])
+                # Re-applying an add after an interrupted compaction must not duplicate the asset.
+                by_id.setdefault(asset.asset_id, asset)
+            elif op == "delete":
+                for asset_id in record.get("asset_ids", []):
+                    by_id.pop(asset_id, None)
+    return list(by_id.values())
+
+
+def _catalog_row(proj: Project) -> tuple[Any, ...]:
+    counts = Counter(a.kind for a in proj.assets)
+    return (
+        proj.project_id,
+        proj.name,
+        proj.brand_name,
+        proj.campaign_name,
+        proj.created_at,
+        len(proj.assets),
+        json.dumps(dict(counts), sort_keys=True),
+    )
+
+
+class AssetTransaction:
+    """
+    Stages several assets and commits their metadata in one journal write.
+    Obtain one via ProjectStore.transaction() (or async_transaction() in async handlers);
+    files are written as they are staged.
+    """
+
+    def __init__(self, store: ProjectStore, project_id: str) -> None:
+        self.store = store
+        self.project_id = project_id
+        self.assets: list[Asset] = []
+
+    def add_asset(
+        self,
+        kind: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        metadata: dict[str, Any] | None = None,
+    ) -> Asset:
+        asset = self.store._stage_asset(self.project_id, kind, filename, content, metadata)
+        self.assets.append(asset)
+        return asset
+
+    async def add_asset_stream(
+        self,
+        kind: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        metadata: dict[str, Any] | None = None,
+    ) -> Asset:
+        asset = await self.store._stage_asset_stream(self.project_id, kind, filename, chunks, metadata)
+        self.assets.append(asset)
+        return asset
 
 
 class ProjectStore:
@@ -57,17 +225,30 @@ class ProjectStore:
         self.root_dir = Path(root_dir or settings.data_dir).resolve()
         self.projects_dir = self.root_dir / "projects"
         self.projects_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog_path = self.root_dir / "catalog.sqlite3"
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # (project_id, rel_path) of blobs referenced by staged-but-uncommitted assets.
+        self._pending_blobs: Counter[tuple[str, str]] = Counter()
+        # project_id -> (file validation token, parsed Project), most recently used last.
+        self._project_cache: OrderedDict[str, tuple[tuple[Any, ...], Project]] = OrderedDict()
+        self._project_cache_size = max(0, settings.project_cache_size)
+        self._project_cache_lock = threading.Lock()
+        self.project_cache_hits = 0
+        self.project_cache_misses = 0
+        # Existing data dirs (or a deleted catalog) are recovered from the JSON files.
+        needs_rebuild = not self.catalog_path.exists()
+        with closing(self._catalog_connect()) as conn, conn:
+            conn.execute(_CATALOG_SCHEMA)
+        if needs_rebuild:
+            self.rebuild_catalog()
 
     def create_project(self, name: str, brand_name: str | None = None, campaign_name: str | None = None) -> Project:
         project_id = uuid.uuid4().hex[:12]
         proj_dir = self.projects_dir / project_id
-        (proj_dir / "assets").mkdir(parents=True, exist_ok=True)
-        (proj_dir / "motifs").mkdir(parents=True, exist_ok=True)
+        (proj_dir / "blobs").mkdir(parents=True, exist_ok=True)
         (proj_dir / "profiles").mkdir(parents=True, exist_ok=True)
-        (proj_dir / "kvs").mkdir(parents=True, exist_ok=True)
-        (proj_dir / "masters").mkdir(parents=True, exist_ok=True)
         (proj_dir / "layouts").mkdir(parents=True, exist_ok=True)
-        (proj_dir / "text_previews").mkdir(parents=True, exist_ok=True)
         (proj_dir / "runs").mkdir(parents=True, exist_ok=True)
 
         proj = Project(
@@ -79,26 +260,86 @@ class ProjectStore:
             assets=[],
             observed_profile=None,
         )
+        proj.index_assets()
         self._write_project(proj)
+        self._catalog_upsert(proj)
         return proj
 
-    def list_projects(self) -> list[Project]:
-        out: list[Project] = []
+    def list_projects(self) -> list[ProjectSummary]:
+        with closing(self._catalog_connect()) as conn:
+            rows = conn.execute(
+                "SELECT project_id, name, brand_name, campaign_name, created_at, asset_count, asset_counts "
+                "FROM projects ORDER BY project_id"
+            ).fetchall()
+        return [
+            ProjectSummary(
+                project_id=r[0],
+                name=r[1],
+                brand_name=r[2],
+                campaign_name=r[3],
+                created_at=r[4],
+                asset_count=r[5],
+                asset_counts=json.loads(r[6] or "{}"),
+            )
+            for r in rows
+        ]
+
+    def rebuild_catalog(self) -> int:
+        """
+        Recreate the catalog from the project.json files on disk. Returns the number of projects indexed.
+        """
+        projects: list[Project] = []
         for proj_dir in sorted(self.projects_dir.glob("*")):
             if not proj_dir.is_dir():
                 continue
             try:
-                out.append(self.read_project(proj_dir.name))
+                projects.append(self._load_project(proj_dir.name))
             except Exception:
                 # Ignore corrupted projects for v0.
                 continue
-        return out
+        with closing(self._catalog_connect()) as conn, conn:
+            conn.execute("DELETE FROM projects")
+            conn.executemany(_CATALOG_UPSERT, [_catalog_row(p) for p in projects])
+        return len(projects)
 
     def read_project(self, project_id: str) -> Project:
-        proj_path = self.projects_dir / project_id / "project.json"
-        data = json.loads(proj_path.read_text("utf-8"))
+        """
+        Cached read. Entries are revalidated against project.json/journal mtime and size,
+        so the returned Project is shared between callers and must be treated as read-only.
+        """
+        token = self._project_token(project_id)
+        with self._project_cache_lock:
+            entry = self._project_cache.get(project_id)
+            if entry is not None and entry[0] == token:
+                self._project_cache.move_to_end(project_id)
+                self.project_cache_hits += 1
+                return entry[1]
+            self.project_cache_misses += 1
+
+        proj = self._load_project(project_id)
+        if self._project_cache_size:
+            with self._project_cache_lock:
+                self._project_cache[project_id] = (token, proj)
+                self._project_cache.move_to_end(project_id)
+                while len(self._project_cache) > self._project_cache_size:
+                    self._project_cache.popitem(last=False)
+        return proj
+
+    def project_cache_info(self) -> dict[str, int]:
+        with self._project_cache_lock:
+            return {
+                "hits": self.project_cache_hits,
+                "misses": self.project_cache_misses,
+                "size": len(self._project_cache),
+                "maxsize": self._project_cache_size,
+            }
+
+    def _load_project(self, project_id: str) -> Project:
+        proj_dir = self.projects_dir / project_id
+        data = json.loads((proj_dir / "project.json").read_text("utf-8"))
         assets = [Asset(**a) for a in data.get("assets", [])]
-        return Project(
+        assets = _replay_journal(assets, proj_dir / _JOURNAL_NAME)
+        proj = Project(
             project_id=data["project_id"],
             name=data["name"],
             brand_name=data.get("brand_name"),
@@ -107,6 +348,8 @@ class ProjectStore:
             assets=assets,
             observed_profile=data.get("observed_profile"),
         )
+        proj.index_assets()
+        return proj
 
     def delete_project(self, project_id: str) -> None:
         proj_dir = (self.projects_dir / project_id).resolve()
@@ -114,64 +357,234 @@ class ProjectStore:
             raise ValueError("Refusing to delete outside projects_dir")
         if proj_dir.exists():
             shutil.rmtree(proj_dir)
+        self._invalidate_project(project_id)
+        with closing(self._catalog_connect()) as conn, conn:
+            conn.execute("DELETE FROM projects WHERE project_id = ?", (project_id,))
 
     def delete_asset(self, project_id: str, asset_id: str) -> None:
-        proj = self.read_project(project_id)
-        remaining: list[Asset] = []
-        removed: list[Asset] = []
-        for a in proj.assets:
-            if a.asset_id == asset_id:
-                removed.append(a)
-            else:
-                remaining.append(a)
-        if not removed:
-            return
+        self.delete_assets(project_id, [asset_id])
 
-        proj.assets = remaining
-        self._write_project(proj)
+    def delete_assets(self, project_id: str, asset_ids: list[str]) -> list[Asset]:
+        """
+        Remove several assets in one metadata commit: one load, one journal record, one
+        blob release pass and one catalog update. Unknown ids are ignored; returns the
+        assets that were removed.
+        """
+        wanted = set(asset_ids)
+        with self._project_lock(project_id):
+            proj = self._load_project(project_id)
+            remaining: list[Asset] = []
+            removed: list[Asset] = []
+            for a in proj.assets:
+                if a.asset_id in wanted:
+                    removed.append(a)
+                else:
+                    remaining.append(a)
+            if not removed:
+                return []
 
-        for a in removed:
-            path = self.abs_asset_path(project_id, a)
-            try:
-                path.unlink(missing_ok=True)
-            except Exception:
-                # Best-effort deletion in v0.
-                pass
+            proj.assets = remaining
+            proj.index_assets()
+            self._append_journal(project_id, [{"op": "delete", "asset_ids": [a.asset_id for a in removed]}])
+            self._invalidate_project(project_id)
+            self._maybe_compact(project_id)
+            # Blobs are shared by identical content; only drop the file with its last reference.
+            for rel_path in {a.rel_path for a in removed}:
+                self._release_blob(proj, rel_path)
+        self._catalog_upsert(proj)
+        return removed
+
+    @contextmanager
+    def transaction(self, project_id: str) -> Iterator[AssetTransaction]:
+        """
+        Batch several add_asset calls into a single metadata commit:
+
+            with store.transaction(project_id) as tx:
+                tx.add_asset(kind="kv", filename="a.png", content=...)
+
+        If the block (or the journal write when committing) raises, staged files are
+        removed and nothing is recorded.
+        """
+        tx = AssetTransaction(self, project_id)
+        try:
+            yield tx
+        except BaseException:
+            self._rollback_assets(project_id, tx.assets)
+            raise
+        self._commit_assets(project_id, tx.assets)
+
+    @asynccontextmanager
+    async def async_transaction(self, project_id: str) -> AsyncIterator[AssetTransaction]:
+        """
+        transaction() for async handlers: the commit (journal append, catalog update) and
+        rollback run on the blocking executor instead of the event loop. Stage bytes with
+        `await run_blocking(tx.add_asset, ...)` or `await tx.add_asset_stream(...)`.
+        """
+        tx = AssetTransaction(self, project_id)
+        try:
+            yield tx
+        except BaseException:
+            await run_blocking(self._rollback_assets, project_id, list(tx.assets))
+            raise
+        await run_blocking(self._commit_assets, project_id, tx.assets)
 
     def add_asset(
         self,
         project_id: str,
         kind: str,
         filename: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         metadata: dict[str, Any] | None = None,
-        subdir: str = "assets",
     ) -> Asset:
-        proj_dir = self.projects_dir / project_id
-        asset_id = uuid.uuid4().hex[:12]
-        filename = _safe_filename(filename)
+        """
+        `content` may be bytes or a binary file-like object; file-like sources are
+        streamed to disk and hashed in one pass instead of being read into memory.
+        """
+        with self.transaction(project_id) as tx:
+            return tx.add_asset(kind, filename, content, metadata=metadata)
+
+    async def add_asset_stream(
+        self,
+        project_id: str,
+        kind: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        metadata: dict[str, Any] | None = None,
+    ) -> Asset:
+        async with self.async_transaction(project_id) as tx:
+            return await tx.add_asset_stream(kind, filename, chunks, metadata=metadata)
+
+    def _stage_asset(
+        self,
+        project_id: str,
+        kind: str,
+        filename: str,
+        content: bytes | BinaryIO,
+        metadata: dict[str, Any] | None,
+    ) -> Asset:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            # Hash straight from the buffer; the bytes are only written if the blob is new.
+            sha256 = hashlib.sha256(content).hexdigest()
+            rel_path = self._place_blob(project_id, sha256, content=bytes(content))
+        else:
+            tmp_path = self._blob_tmp_path(project_id)
+            h = hashlib.sha256()
+            try:
+                with tmp_path.open("wb") as f:
+                    for chunk in iter(lambda: content.read(_BLOB_CHUNK_BYTES), b""):
+                        h.update(chunk)
+                        f.write(chunk)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            sha256 = h.hexdigest()
+            rel_path = self._place_blob(project_id, sha256, tmp_path=tmp_path)
+        return self._new_asset(kind, filename, rel_path, sha256, metadata)
 
-        out_dir = proj_dir / subdir
-        out_dir.mkdir(parents=True, exist_ok=True)
+    async def _stage_asset_stream(
+        self,
+        project_id: str,
+        kind: str,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        metadata: dict[str, Any] | None,
+    ) -> Asset:
+        tmp_path = self._blob_tmp_path(project_id)
+        h = hashlib.sha256()
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    h.update(chunk)
+                    await f.write(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        sha256 = h.hexdigest()
+        rel_path = await run_blocking(self._place_blob, project_id, sha256, tmp_path=tmp_path)
+        return self._new_asset(kind, filename, rel_path, sha256, metadata)
 
-        rel_path = str(Path(subdir) / f"{asset_id}_{filename}")
-        abs_path = proj_dir / rel_path
-        abs_path.write_bytes(content)
+    def _blob_tmp_path(self, project_id: str) -> Path:
+        # Spool next to the blobs so the final rename stays on one filesystem.
+        tmp_dir = self.projects_dir / project_id / "blobs" / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        return tmp_dir / f"{uuid.uuid4().hex}.part"
 
-        asset = Asset(
-            asset_id=asset_id,
+    def _place_blob(
+        self,
+        project_id: str,
+        sha256: str,
+        content: bytes | None = None,
+        tmp_path: Path | None = None,
+    ) -> str:
+        """
+        Move spooled or in-memory content to its content address (deduplicating) and
+        pin it until the owning transaction commits.
+        """
+        rel_path = _blob_rel_path(sha256)
+        abs_path = self.projects_dir / project_id / rel_path
+        if tmp_path is None and not abs_path.exists():
+            tmp_path = self._blob_tmp_path(project_id)
+            tmp_path.write_bytes(content or b"")
+        with self._project_lock(project_id):
+            # Pin before the commit so a concurrent delete of the last reference keeps the file.
+            self._pending_blobs[(project_id, rel_path)] += 1
+            if abs_path.exists():
+                if tmp_path is not None:
+                    tmp_path.unlink(missing_ok=True)
+            elif tmp_path is not None:
+                abs_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, abs_path)
+            else:
+                # The last reference was deleted after our existence check; write it back.
+                abs_path.parent.mkdir(parents=True, exist_ok=True)
+                abs_path.write_bytes(content or b"")
+        return rel_path
+
+    def _new_asset(
+        self,
+        kind: str,
+        filename: str,
+        rel_path: str,
+        sha256: str,
+        metadata: dict[str, Any] | None,
+    ) -> Asset:
+        return Asset(
+            asset_id=uuid.uuid4().hex[:12],
             kind=kind,
-            filename=filename,
+            filename=_safe_filename(filename),
             rel_path=rel_path,
-            sha256=_sha256_file(abs_path),
+            sha256=sha256,
             created_at=_now_iso(),
             metadata=metadata or {},
         )
 
-        proj = self.read_project(project_id)
-        proj.assets.append(asset)
-        self._write_project(proj)
-        return asset
+    def _rollback_assets(self, project_id: str, assets: list[Asset]) -> None:
+        # Undo staging: drop the pins and delete blobs nothing else references.
+        with self._project_lock(project_id):
+            self._unpin_blobs(project_id, assets)
+            proj = self._load_project(project_id)
+            for asset in assets:
+                self._release_blob(proj, asset.rel_path)
+
+    def _commit_assets(self, project_id: str, assets: list[Asset]) -> None:
+        if not assets:
+            return
+        appended = False
+        try:
+            with self._project_lock(project_id):
+                self._append_journal(project_id, [{"op": "add", "asset": asdict(a)} for a in assets])
+                appended = True
+                self._unpin_blobs(project_id, assets)
+                self._invalidate_project(project_id)
+                self._maybe_compact(project_id)
+        except BaseException:
+            if not appended:
+                # Nothing was recorded; release the pins and staged blobs like a rollback.
+                self._rollback_assets(project_id, assets)
+            raise
+        finally:
+            if appended:
+                self._catalog_adjust(project_id, Counter(a.kind for a in assets))
 
     def abs_asset_path(self, project_id: str, asset: Asset) -> Path:
         return self.projects_dir / project_id / asset.rel_path
@@ -182,9 +595,10 @@ class ProjectStore:
             json.dumps(profile, indent=2),
             encoding="utf-8",
         )
-        proj = self.read_project(project_id)
-        proj.observed_profile = profile
-        self._write_project(proj)
+        with self._project_lock(project_id):
+            proj = self._load_project(project_id)
+            proj.observed_profile = profile
+            self._compact(proj)
 
     def write_run_manifest(self, project_id: str, manifest: dict[str, Any]) -> Path:
         proj_dir = self.projects_dir / project_id
@@ -196,10 +610,119 @@ class ProjectStore:
         path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
         return path
 
+    def _project_lock(self, project_id: str) -> threading.Lock:
+        # Serializes journal appends against compaction within this process.
+        with self._locks_guard:
+            lock = self._locks.get(project_id)
+            if lock is None:
+                lock = self._locks[project_id] = threading.Lock()
+            return lock
+
+    def _append_journal(self, project_id: str, records: list[dict[str, Any]]) -> None:
+        payload = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records).encode("utf-8")
+        # Unbuffered so a failed write (e.g. ENOSPC) can be cut back to the previous end.
+        with (self.projects_dir / project_id / _JOURNAL_NAME).open("ab", buffering=0) as f:
+            start = f.seek(0, os.SEEK_END)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[f.write(view) :]
+            except BaseException:
+                f.truncate(start)
+                raise
+
+    def _maybe_compact(self, project_id: str) -> None:
+        proj_dir = self.projects_dir / project_id
+        try:
+            journal_size = (proj_dir / _JOURNAL_NAME).stat().st_size
+            snapshot_size = (proj_dir / "project.json").stat().st_size
+        except FileNotFoundError:
+            return
+        if journal_size > max(_JOURNAL_COMPACT_MIN_BYTES, snapshot_size):
+            self._compact(self._load_project(project_id))
+
+    def _compact(self, proj: Project) -> None:
+        # Snapshot first, then drop the journal; replay is idempotent if we crash in between.
+        self._write_project(proj)
+        (self.projects_dir / proj.project_id / _JOURNAL_NAME).unlink(missing_ok=True)
+        self._invalidate_project(proj.project_id)
+
+    def _unpin_blobs(self, project_id: str, assets: list[Asset]) -> None:
+        for a in assets:
+            key = (project_id, a.rel_path)
+            self._pending_blobs[key] -= 1
+            if self._pending_blobs[key] <= 0:
+                del self._pending_blobs[key]
+
+    def _release_blob(self, proj: Project, rel_path: str) -> None:
+        # Caller holds the project lock and passes the project state after the change.
+        if proj.blob_refcount(rel_path) > 0 or self._pending_blobs.get((proj.project_id, rel_path)):
+            return
+        try:
+            (self.projects_dir / proj.project_id / rel_path).unlink(missing_ok=True)
+        except Exception:
+            # Best-effort deletion in v0.
+            pass
+
+    def _project_token(self, project_id: str) -> tuple[Any, ...]:
+        proj_dir = self.projects_dir / project_id
+        st = (proj_dir / "project.json").stat()
+        try:
+            jst = (proj_dir / _JOURNAL_NAME).stat()
+            journal = (jst.st_mtime_ns, jst.st_size)
+        except FileNotFoundError:
+            journal = None
+        return (st.st_mtime_ns, st.st_size, journal)
+
+    def _invalidate_project(self, project_id: str) -> None:
+        with self._project_cache_lock:
+            self._project_cache.pop(project_id, None)
+
+    def _catalog_connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.catalog_path, timeout=30)
+
+    def _catalog_upsert(self, proj: Project) -> None:
+        with closing(self._catalog_connect()) as conn, conn:
+            conn.execute(_CATALOG_UPSERT, _catalog_row(proj))
+
+    def _catalog_adjust(self, project_id: str, delta: Counter[str]) -> None:
+        with closing(self._catalog_connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT asset_counts FROM projects WHERE project_id = ?", (project_id,)).fetchone()
+            if row is None:
+                # Catalog is behind the JSON files; rebuild_catalog() recovers it.
+                return
+            counts = Counter(json.loads(row[0] or "{}"))
+            counts.update(delta)
+            counts = Counter({k: v for k, v in counts.items() if v > 0})
+            conn.execute(
+                "UPDATE projects SET asset_count = ?, asset_counts = ? WHERE project_id = ?",
+                (sum(counts.values()), json.dumps(dict(counts), sort_keys=True), project_id),
+            )
+
     def _write_project(self, proj: Project) -> None:
         proj_dir = self.projects_dir / proj.project_id
         proj_dir.mkdir(parents=True, exist_ok=True)
         path = proj_dir / "project.json"
-        data = asdict(proj)
+        data = {f.name: getattr(proj, f.name) for f in fields(proj) if f.init}
         data["assets"] = [asdict(a) for a in proj.assets]
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m performance_genai.storage")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("rebuild-catalog", help="rebuild the project catalog from project.json files")
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild-catalog":
+        store = ProjectStore()
+        count = store.rebuild_catalog()
+        print(f"indexed {count} projects into {store.catalog_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())